@@ -1,8 +1,12 @@
 import pytest
 from pytest_benchmark.fixture import BenchmarkFixture
 
-from protarrow import messages_to_record_batch, record_batch_to_messages
-from protarrow_protos.bench_pb2 import ExampleMessage
+from protarrow import (
+    ProtarrowConfig,
+    messages_to_record_batch,
+    record_batch_to_messages,
+)
+from protarrow_protos.bench_pb2 import ExampleMessage, NestedExampleMessage
 from tests.random_generator import generate_messages
 
 SIZES = [10, 100, 1_000, 10_000]
@@ -14,6 +18,34 @@ def test_messages_to_record_batch(benchmark: BenchmarkFixture, size):
     benchmark(messages_to_record_batch, source_messages, ExampleMessage)
 
 
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("single_pass", [False, True])
+def test_messages_to_record_batch_engine(
+    benchmark: BenchmarkFixture, size, single_pass
+):
+    source_messages = generate_messages(NestedExampleMessage, size, 10)
+    benchmark(
+        messages_to_record_batch,
+        source_messages,
+        NestedExampleMessage,
+        ProtarrowConfig(single_pass=single_pass),
+    )
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("single_pass", [False, True])
+def test_messages_to_record_batch_sparse(
+    benchmark: BenchmarkFixture, size, single_pass
+):
+    source_messages = [ExampleMessage(int32_value=i) for i in range(size)]
+    benchmark(
+        messages_to_record_batch,
+        source_messages,
+        ExampleMessage,
+        ProtarrowConfig(single_pass=single_pass),
+    )
+
+
 @pytest.mark.parametrize("size", SIZES)
 def test_record_batch_to_messages(benchmark: BenchmarkFixture, size):
     source_messages = generate_messages(ExampleMessage, size, 10)
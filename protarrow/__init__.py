@@ -1,5 +1,12 @@
 from protarrow._version import version
-from protarrow.arrow_to_proto import record_batch_to_messages, table_to_messages
+from protarrow.arrow_to_proto import (
+    LazyMessageSequence,
+    iter_table_messages,
+    record_batch_to_lazy_messages,
+    record_batch_to_messages,
+    record_batch_to_serialized,
+    table_to_messages,
+)
 from protarrow.cast_to_proto import cast_record_batch, cast_struct_array, cast_table
 from protarrow.common import ProtarrowConfig
 from protarrow.message_extractor import MessageExtractor
@@ -7,20 +14,30 @@ from protarrow.proto_to_arrow import (
     message_type_to_schema,
     message_type_to_struct_type,
     messages_to_record_batch,
+    messages_to_record_batch_reader,
+    messages_to_record_batches,
     messages_to_table,
+    serialized_to_record_batch,
 )
 
 __version__ = version
 __all__ = [
+    "LazyMessageSequence",
     "MessageExtractor",
     "ProtarrowConfig",
     "cast_record_batch",
     "cast_struct_array",
     "cast_table",
+    "iter_table_messages",
     "message_type_to_schema",
     "message_type_to_struct_type",
     "messages_to_record_batch",
+    "messages_to_record_batch_reader",
+    "messages_to_record_batches",
     "messages_to_table",
+    "record_batch_to_lazy_messages",
     "record_batch_to_messages",
+    "record_batch_to_serialized",
+    "serialized_to_record_batch",
     "table_to_messages",
 ]
@@ -1,9 +1,24 @@
+import collections
 import collections.abc
 import dataclasses
 import datetime
-from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, Type, Union
+import itertools
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 import pyarrow as pa
+import pyarrow.compute as pc
 from google.protobuf.descriptor import Descriptor, EnumDescriptor, FieldDescriptor
 from google.protobuf.duration_pb2 import Duration
 from google.protobuf.internal.containers import MessageMap
@@ -25,11 +40,22 @@ from google.type.timeofday_pb2 import TimeOfDay
 
 from protarrow.common import (
     _INVALID_DATE_SENTINEL,
+    DEFAULT_BATCH_SIZE,
     M,
+    _check_range,
+    check_timestamp_seconds,
     is_binary_enum,
     is_string_enum,
     offset_values_array,
 )
+from protarrow.parallel import (
+    check_workers,
+    get_file_descriptor_set,
+    get_message_class,
+    ipc_to_record_batch,
+    map_in_processes,
+    record_batch_to_ipc,
+)
 
 _NANOS_PER_UNIT = {"ns": 1, "us": 1_000, "ms": 1_000_000, "s": 1_000_000_000}
 _TIME_CONVERTER = {
@@ -71,6 +97,29 @@ def _date_scalar_to_proto(scalar: pa.Date32Scalar) -> Date:
     return Date(year=date.year, month=date.month, day=date.day)
 
 
+def _date32_to_civil(
+    array: pa.Array,
+) -> Tuple[List[Optional[int]], List[Optional[int]], List[Optional[int]]]:
+    """
+    Vectorized conversion of date32 to year, month and day.
+
+    `_INVALID_DATE_SENTINEL` is converted to zeros, like an empty `Date`.
+    """
+    is_invalid = pc.equal(array.cast(pa.int32()), _INVALID_DATE_SENTINEL)
+    years = pc.year(array)
+    _check_range(
+        pc.if_else(is_invalid, 1, years),
+        1,
+        9999,
+        "Date is not valid: Year must be in range [1, 9999].",
+    )
+    years, months, days = (
+        pc.if_else(is_invalid, 0, component).to_pylist()
+        for component in (years, pc.month(array), pc.day(array))
+    )
+    return years, months, days
+
+
 def _time_64_ns_scalar_to_proto(scalar: pa.Time64Scalar) -> TimeOfDay:
     total_nanos = scalar.value
     return TimeOfDay(
@@ -162,6 +211,49 @@ TEMPORAL_CONVERTERS = {
     Duration.DESCRIPTOR: lambda data_type: DURATION_CONVERTERS[data_type.unit],
 }
 
+
+def _floor_divmod(values: pa.Array, divisor: int) -> Tuple[pa.Array, pa.Array]:
+    """Like python's `divmod`, for integer arrays (`pc.divide` truncates)"""
+    quotients = pc.divide(values, divisor)
+    remainders = pc.subtract(values, pc.multiply(quotients, divisor))
+    negative = pc.less(remainders, 0)
+    return (
+        pc.if_else(negative, pc.subtract(quotients, 1), quotients),
+        pc.if_else(negative, pc.add(remainders, divisor), remainders),
+    )
+
+
+def _temporal_to_components(
+    array: pa.Array, message_descriptor: Descriptor
+) -> Dict[str, List[Optional[int]]]:
+    """
+    Split a temporal array into the fields of its message, in bulk.
+
+    `Timestamp` and `Duration` get `seconds` and `nanos`, and `TimeOfDay` gets
+    `hours`, `minutes`, `seconds` and `nanos`. Nulls are None.
+    """
+    nanos_per_unit = _NANOS_PER_UNIT[array.type.unit]
+    integers = array.cast(
+        pa.int32() if array.type.bit_width == 32 else pa.int64()
+    ).cast(pa.int64())
+    seconds, units = _floor_divmod(integers, 1_000_000_000 // nanos_per_unit)
+    if message_descriptor == Timestamp.DESCRIPTOR:
+        check_timestamp_seconds(seconds)
+    nanos = pc.multiply(units, nanos_per_unit)
+    if message_descriptor == TimeOfDay.DESCRIPTOR:
+        minutes, seconds = _floor_divmod(seconds, 60)
+        hours, minutes = _floor_divmod(minutes, 60)
+        components = {
+            "hours": hours,
+            "minutes": minutes,
+            "seconds": seconds,
+            "nanos": nanos,
+        }
+    else:
+        components = {"seconds": seconds, "nanos": nanos}
+    return {name: values.to_pylist() for name, values in components.items()}
+
+
 NULLABLE_TYPES = (
     BoolValue.DESCRIPTOR,
     BytesValue.DESCRIPTOR,
@@ -190,34 +282,6 @@ def is_custom_field(field_descriptor: FieldDescriptor):
     )
 
 
-@dataclasses.dataclass(frozen=True)
-class OffsetsIterator:
-    offsets: pa.Array
-
-    def __iter__(self) -> Iterator[Tuple[int, int]]:
-        if len(self.offsets) > 0:
-            current_offset = self.offsets[0].as_py()
-            for item in self.offsets[1:]:
-                offset = item.as_py()
-                yield current_offset, offset
-                current_offset = offset
-
-
-@dataclasses.dataclass(frozen=True)
-class ListValuesIterator:
-    """
-    Iterate through ListArray underlying values taking offsets into consideration.
-    """
-
-    list_array: pa.ListArray
-
-    def __iter__(self) -> Iterator[pa.Scalar]:
-        values_array = self.list_array.values
-        for first, last in OffsetsIterator(self.list_array.offsets):
-            for value in values_array[first:last]:
-                yield value
-
-
 @dataclasses.dataclass(frozen=True)
 class OffsetToSize(collections.abc.Iterable):
     array: pa.Array
@@ -226,71 +290,143 @@ class OffsetToSize(collections.abc.Iterable):
         assert pa.types.is_integer(self.array.type)
 
     def __iter__(self) -> Iterator[int]:
-        if len(self.array) > 0:
-            current_offset = self.array[0].as_py()
-            for item in self.array[1:]:
-                offset = item.as_py()
-                yield offset - current_offset
-                current_offset = offset
+        offsets = self.array.to_pylist()
+        for current_offset, offset in zip(offsets, offsets[1:]):
+            yield offset - current_offset
 
 
 @dataclasses.dataclass(frozen=True)
 class OptionalNestedIterable(collections.abc.Iterable):
     parents: Iterable[Message]
     field_descriptor: FieldDescriptor
-    validity_mask: Iterable[pa.BooleanScalar]
+    validity_mask: Iterable[bool]
 
     def __iter__(self) -> Iterator[Optional[Any]]:
         for parent, valid in zip(self.parents, self.validity_mask):
-            if valid.is_valid and valid.as_py() and parent is not None:
+            if valid and parent is not None:
                 yield getattr(parent, self.field_descriptor.name)
             else:
                 yield None
 
-    def prime(self):
-        """This needs to be called if there are no fields in the message"""
-        empty = self.field_descriptor.message_type._concrete_class()
-        for parent, valid in zip(self.parents, self.validity_mask):
-            if valid.is_valid and valid.as_py() and parent is not None:
-                value = getattr(parent, self.field_descriptor.name)
-                value.MergeFrom(empty)
-
-
-@dataclasses.dataclass(frozen=True)
-class RepeatedNestedIterable(collections.abc.Iterable):
-    parents: Iterable[Message]
-    field_descriptor: FieldDescriptor
-
-    def __post_init__(self):
-        assert self.field_descriptor.is_repeated
-        assert self.field_descriptor.type == FieldDescriptor.TYPE_MESSAGE
-
-    def __iter__(self) -> Iterator[Any]:
-        for parent in self.parents:
-            if parent is not None:
-                for child in getattr(parent, self.field_descriptor.name):
-                    yield child
+    def resolve(self) -> List[Optional[Message]]:
+        """Resolve the nested messages once, marking the valid ones as present"""
+        nested = list(self)
+        for value in nested:
+            if value is not None:
+                value.SetInParent()
+        return nested
 
 
 def convert_scalar(scalar: pa.Scalar) -> Any:
     return scalar.as_py()
 
 
-def create_enum_converter(
+def _get_enum_mapping(
     enum_descriptor: EnumDescriptor, arrow_type: pa.DataType
-) -> Callable[[pa.Scalar], int]:
+) -> Optional[Dict[Union[str, bytes], int]]:
+    """Return the name to number mapping of an enum, or None for integer enums"""
     if pa.types.is_integer(arrow_type):
-        return lambda x: x.as_py()
+        return None
     elif is_binary_enum(arrow_type):
-        mapping = {v.name.encode("utf-8"): v.number for v in enum_descriptor.values}
-        return lambda x: mapping.get(x.as_py(), 0)
+        return {v.name.encode("utf-8"): v.number for v in enum_descriptor.values}
     elif is_string_enum(arrow_type):
-        mapping = {v.name: v.number for v in enum_descriptor.values}
-        return lambda x: mapping.get(x.as_py(), 0)
+        return {v.name: v.number for v in enum_descriptor.values}
     else:
         raise TypeError(arrow_type)
 
 
+def create_enum_converter(
+    enum_descriptor: EnumDescriptor, arrow_type: pa.DataType
+) -> Callable[[pa.Scalar], int]:
+    mapping = _get_enum_mapping(enum_descriptor, arrow_type)
+    if mapping is None:
+        return lambda x: x.as_py()
+    else:
+        return lambda x: mapping.get(x.as_py(), 0)
+
+
+def _enum_array_to_numbers(
+    array: pa.Array, enum_descriptor: EnumDescriptor
+) -> pa.Array:
+    """
+    Convert an enum array to enum numbers, in bulk. Unknown names map to 0.
+
+    Dictionary arrays only have their dictionary converted.
+    """
+    if pa.types.is_dictionary(array.type):
+        return _enum_array_to_numbers(array.dictionary, enum_descriptor).take(
+            array.indices
+        )
+    mapping = _get_enum_mapping(enum_descriptor, array.type)
+    if mapping is None:
+        return array
+    numbers = pa.array(mapping.values(), pa.int32()).take(
+        pc.index_in(array, value_set=pa.array(mapping.keys(), array.type))
+    )
+    if numbers.null_count > array.null_count:
+        numbers = pc.if_else(array.is_valid(), pc.fill_null(numbers, 0), numbers)
+    return numbers
+
+
+def _array_to_values(array: pa.Array, field_descriptor: FieldDescriptor) -> List[Any]:
+    """
+    Convert a flat array to the python values of a field, in bulk. Nulls are None.
+
+    Well known types, like `Timestamp`, are converted to messages.
+    Wrapped types, like `DoubleValue`, are not wrapped (see `_wrap_values`).
+    """
+    if field_descriptor.type == FieldDescriptor.TYPE_ENUM:
+        return _enum_array_to_numbers(array, field_descriptor.enum_type).to_pylist()
+    elif field_descriptor.message_type == Date.DESCRIPTOR:
+        return [
+            None if year is None else Date(year=year, month=month, day=day)
+            for year, month, day in zip(*_date32_to_civil(array))
+        ]
+    elif field_descriptor.message_type in TEMPORAL_CONVERTERS:
+        message_type = field_descriptor.message_type._concrete_class
+        components = _temporal_to_components(array, field_descriptor.message_type)
+        names = list(components)
+        return [
+            None if values[0] is None else message_type(**dict(zip(names, values)))
+            for values in zip(*components.values())
+        ]
+    else:
+        return array.to_pylist()
+
+
+def _wrap_values(values: List[Any], field_descriptor: FieldDescriptor) -> List[Any]:
+    if field_descriptor.message_type in NULLABLE_TYPES:
+        wrapped_type = field_descriptor.message_type._concrete_class
+        return [
+            None if value is None else wrapped_type(value=value) for value in values
+        ]
+    else:
+        return values
+
+
+def _array_to_repeated_values(
+    array: pa.Array, field_descriptor: FieldDescriptor
+) -> List[Any]:
+    """
+    Convert a flat array to the python values of a repeated field, in bulk.
+
+    Null enums are 0, null wrapped types are empty wrappers,
+    as `None` can't be appended to repeated fields.
+    """
+    if field_descriptor.type == FieldDescriptor.TYPE_ENUM:
+        return pc.fill_null(
+            _enum_array_to_numbers(array, field_descriptor.enum_type), 0
+        ).to_pylist()
+    elif field_descriptor.message_type in NULLABLE_TYPES:
+        wrapped_type = field_descriptor.message_type._concrete_class
+        return [
+            wrapped_type() if value is None else wrapped_type(value=value)
+            for value in array.to_pylist()
+        ]
+    else:
+        return _array_to_values(array, field_descriptor)
+
+
 def get_converter(
     field_descriptor: FieldDescriptor, arrow_type: pa.DataType
 ) -> Callable[[pa.Scalar], Any]:
@@ -308,23 +444,20 @@ class PlainAssigner(collections.abc.Iterable):
         self,
         messages: Iterable[Message],
         field_descriptor: FieldDescriptor,
-        arrow_type: pa.DataType,
     ):
         self.messages = messages
         self.field_descriptor = field_descriptor
-        self.converter = get_converter(field_descriptor, arrow_type)
         self.nullable = self.field_descriptor.message_type in NULLABLE_TYPES
         self.message = None
 
-    def __iter__(self) -> Iterator[Callable[[pa.Scalar], None]]:
+    def __iter__(self) -> Iterator[Callable[[Any], None]]:
         assert self.message is None
         for message in self.messages:
             self.message = message
             yield self
         self.message = None
 
-    def __call__(self, scalar: pa.Scalar) -> None:
-        value = self.converter(scalar) if scalar.is_valid else None
+    def __call__(self, value: Any) -> None:
         # `self.message` can be null for nested messages.
         # We'd expect the scalar to be either null or the default value in this case
         if self.message is not None and value is not None:
@@ -334,67 +467,6 @@ class PlainAssigner(collections.abc.Iterable):
                 setattr(self.message, self.field_descriptor.name, value)
 
 
-class AppendAssigner(collections.abc.Iterable):
-    def __init__(
-        self,
-        messages: Iterable[Message],
-        field_descriptor: FieldDescriptor,
-        sizes: Iterable[int],
-        converter: Callable[[Any], Any],
-    ):
-        self.messages = messages
-        self.field_descriptor = field_descriptor
-        assert self.field_descriptor.is_repeated
-        self.sizes = sizes
-        self.converter = converter
-        self.attribute = None
-
-    def __iter__(self) -> Iterator[Callable[[pa.Scalar], None]]:
-        assert self.attribute is None
-        for message, size in zip(self.messages, self.sizes):
-            if message is not None:
-                self.attribute = getattr(message, self.field_descriptor.name)
-                for _ in range(size):
-                    yield self
-        self.attribute = None
-
-    def __call__(self, scalar: pa.Scalar) -> None:
-        self.attribute.append(self.converter(scalar))
-
-
-@dataclasses.dataclass
-class MapKeyAssigner(collections.abc.Iterable):
-    messages: Iterable[Message]
-    field_descriptor: FieldDescriptor
-    key_arrow_type: dataclasses.InitVar[pa.DataType]
-    sizes: Iterable[int]
-    converter: Callable[[pa.Scalar], Any] = dataclasses.field(init=False)
-    attribute: Any = None
-
-    def __post_init__(self, key_arrow_type: pa.DataType):
-        assert self.field_descriptor.is_repeated
-        assert self.field_descriptor.message_type.GetOptions().map_entry
-        self.converter = get_converter(
-            self.field_descriptor.message_type.fields_by_name["key"], key_arrow_type
-        )
-
-    def __iter__(self) -> Iterator[Callable[[pa.Scalar], Message]]:
-        assert self.attribute is None
-        for message, offset in zip(self.messages, self.sizes):
-            if message is not None:
-                self.attribute = getattr(message, self.field_descriptor.name)
-                for _ in range(offset):
-                    yield self
-        self.attribute = None
-
-    def __call__(self, scalar: pa.Scalar) -> Message:
-        return self.attribute[self.converter(scalar)]
-
-
-def _direct_assign_map(attribute: MessageMap, key: Any, value: Any):
-    attribute[key] = value
-
-
 def _merge_assign_map(attribute: MessageMap, key: Any, value: Any):
     if value is None:
         attribute[key]
@@ -402,58 +474,14 @@ def _merge_assign_map(attribute: MessageMap, key: Any, value: Any):
         attribute[key].MergeFrom(value)
 
 
-@dataclasses.dataclass
-class MapItemAssigner(collections.abc.Iterable):
-    messages: Iterable[Message]
-    field_descriptor: FieldDescriptor
-    key_arrow_type: dataclasses.InitVar[pa.DataType]
-    value_arrow_type: dataclasses.InitVar[pa.DataType]
-    sizes: Iterable[int]
-    key_converter: Callable[[pa.Scalar], Any] = dataclasses.field(init=False)
-    value_converter: Callable[[pa.Scalar], Any] = dataclasses.field(init=False)
-    assigner: Callable[[MessageMap, Any, Any], None] = dataclasses.field(init=False)
-    attribute: Optional[MessageMap] = None
-
-    def __post_init__(self, key_arrow_type: pa.DataType, value_arrow_type: pa.DataType):
-        assert self.field_descriptor.is_repeated
-        assert self.field_descriptor.message_type.GetOptions().map_entry
-        self.key_converter = get_converter(
-            self.field_descriptor.message_type.fields_by_name["key"], key_arrow_type
-        )
-        value_descriptor = self.field_descriptor.message_type.fields_by_name["value"]
-        self.value_converter = WrappedValueConverterAdapter.maybe_wrap(
-            get_converter(value_descriptor, value_arrow_type), value_descriptor
-        )
-        self.assigner = (
-            _merge_assign_map
-            if (value_descriptor.type == FieldDescriptor.TYPE_MESSAGE)
-            else _direct_assign_map
-        )
-
-    def __iter__(self) -> Iterator[Callable[[pa.Scalar, pa.Scalar], Message]]:
-        assert self.attribute is None
-        for message, size in zip(self.messages, self.sizes):
-            if message is not None:
-                self.attribute = getattr(message, self.field_descriptor.name)
-                for _ in range(size):
-                    yield self
-        self.attribute = None
-
-    def __call__(self, key: pa.Scalar, value: pa.Scalar):
-        self.assigner(
-            self.attribute,
-            self.key_converter(key),
-            self.value_converter(value) if value.is_valid else None,
-        )
-
-
 def _extract_struct_field(
     array: pa.StructArray,
     field_descriptor: FieldDescriptor,
     messages: Iterable[Message],
 ) -> None:
-    nested_list = OptionalNestedIterable(messages, field_descriptor, array.is_valid())
-    nested_list.prime()
+    nested_list = OptionalNestedIterable(
+        messages, field_descriptor, array.is_valid().to_pylist()
+    ).resolve()
     _extract_array_messages(array, field_descriptor.message_type, nested_list)
 
 
@@ -486,52 +514,85 @@ def _extract_map_field(
         array = _convert_list_back_to_map(array=array)
 
     assert pa.types.is_map(array.type), array.type
-    value_descriptor = field_descriptor.message_type.fields_by_name["value"]
+    key_descriptor, value_descriptor = (
+        field_descriptor.message_type.fields_by_name["key"],
+        field_descriptor.message_type.fields_by_name["value"],
+    )
 
     values_array = offset_values_array(array, array.items)
-    keys_array = offset_values_array(array, array.keys)
+    keys = _array_to_values(offset_values_array(array, array.keys), key_descriptor)
 
     if is_custom_field(value_descriptor):
-        # Because protobuf doesn't warranty orders of map,
-        # we have to make a copy of the list of values here
-        values = []
-        for assigner, key in zip(
-            MapKeyAssigner(
-                messages,
-                field_descriptor,
-                array.type.key_type,
-                OffsetToSize(array.offsets),
-            ),
-            keys_array,
-        ):
-            values.append(assigner(key))
+        _extract_map_message_values(
+            array, values_array, keys, field_descriptor, messages
+        )
+    else:
+        _extract_map_plain_values(array, values_array, keys, field_descriptor, messages)
+
 
-        assert pa.types.is_struct(array.type.item_type), array.type
-        item_type: pa.StructType = array.type.item_type
-        assert isinstance(item_type, pa.StructType)
+def _extract_map_message_values(
+    array: pa.MapArray,
+    values_array: pa.StructArray,
+    keys: List[Any],
+    field_descriptor: FieldDescriptor,
+    messages: Iterable[Message],
+) -> None:
+    # Because protobuf doesn't warranty orders of map,
+    # we have to make a copy of the list of values here
+    values = []
+    for message, start, end in _iter_entry_ranges(messages, array.offsets):
+        if message is None:
+            values.extend(itertools.repeat(None, end - start))
+        elif start < end:
+            attribute = getattr(message, field_descriptor.name)
+            values.extend(attribute[key] for key in keys[start:end])
+
+    assert pa.types.is_struct(array.type.item_type), array.type
+    item_type: pa.StructType = array.type.item_type
+    assert isinstance(item_type, pa.StructType)
+
+    value_descriptor = field_descriptor.message_type.fields_by_name["value"]
+    for value_field_descriptor in value_descriptor.message_type.fields:
+        field_index = item_type.get_field_index(value_field_descriptor.name)
+        if field_index != -1:
+            _extract_field(
+                values_array.field(field_index),
+                value_field_descriptor,
+                values,
+            )
 
-        for field_descriptor in value_descriptor.message_type.fields:
-            field_index = item_type.get_field_index(field_descriptor.name)
-            if field_index != -1:
-                _extract_field(
-                    values_array.field(field_index),
-                    field_descriptor,
-                    values,
-                )
 
-    else:
-        for assigner, key, value in zip(
-            MapItemAssigner(
-                messages,
-                field_descriptor,
-                array.type.key_type,
-                array.type.item_type,
-                OffsetToSize(array.offsets),
-            ),
-            keys_array,
-            values_array,
-        ):
-            assigner(key, value)
+def _extract_map_plain_values(
+    array: pa.MapArray,
+    values_array: pa.Array,
+    keys: List[Any],
+    field_descriptor: FieldDescriptor,
+    messages: Iterable[Message],
+) -> None:
+    value_descriptor = field_descriptor.message_type.fields_by_name["value"]
+    values = _wrap_values(
+        _array_to_values(values_array, value_descriptor), value_descriptor
+    )
+    merge = value_descriptor.type == FieldDescriptor.TYPE_MESSAGE
+    for message, start, end in _iter_entry_ranges(messages, array.offsets):
+        if message is not None and start < end:
+            attribute = getattr(message, field_descriptor.name)
+            entries = zip(keys[start:end], values[start:end])
+            if merge:
+                for key, value in entries:
+                    _merge_assign_map(attribute, key, value)
+            else:
+                attribute.update(entries)
+
+
+def _iter_entry_ranges(
+    messages: Iterable[Message], offsets: pa.Array
+) -> Iterator[Tuple[Optional[Message], int, int]]:
+    """Yield each message with the range of its entries in the values array"""
+    offsets = offsets.to_pylist()
+    first = offsets[0] if offsets else 0
+    for message, start, end in zip(messages, offsets, offsets[1:]):
+        yield message, start - first, end - first
 
 
 def _extract_repeated_field(
@@ -548,86 +609,97 @@ def _extract_repeated_field(
         _extract_repeated_primitive(array, field_descriptor, messages)
 
 
-@dataclasses.dataclass(frozen=True)
-class WrappedValueConverterAdapter:
-    converter: Callable[[pa.Scalar], Any]
-    wrapped_type: type
-
-    def __call__(self, scalar: pa.Scalar):
-        return self.wrapped_type(value=self.converter(scalar))
-
-    @staticmethod
-    def maybe_wrap(
-        converter: Callable[[pa.Scalar], Any], field_descriptor: FieldDescriptor
-    ) -> Callable[[pa.Scalar], Any]:
-        if field_descriptor.message_type in NULLABLE_TYPES:
-            return WrappedValueConverterAdapter(
-                converter, field_descriptor.message_type._concrete_class
-            )
-        else:
-            return converter
-
-
 def _extract_repeated_primitive(
     array: pa.Array, field_descriptor: FieldDescriptor, messages: Iterable[Message]
 ) -> None:
-    converter = WrappedValueConverterAdapter.maybe_wrap(
-        get_converter(field_descriptor, array.type.value_type), field_descriptor
-    )
-    assigner = AppendAssigner(
-        messages=messages,
-        field_descriptor=field_descriptor,
-        sizes=OffsetToSize(array.offsets),
-        converter=converter,
+    values = _array_to_repeated_values(
+        offset_values_array(array, array.values), field_descriptor
     )
-
-    for each_assigner, value in zip(assigner, ListValuesIterator(array)):
-        each_assigner(value)
+    position = 0
+    for message, size in zip(messages, OffsetToSize(array.offsets)):
+        if message is not None and size > 0:
+            getattr(message, field_descriptor.name).extend(
+                values[position : position + size]
+            )
+        position += size
 
 
 def _extract_repeated_message(
     array: pa.Array, field_descriptor: FieldDescriptor, messages: Iterable[Message]
 ):
     assert pa.types.is_list(array.type) or pa.types.is_large_list(array.type)
-    child = field_descriptor.message_type._concrete_class()
-    assigner = AppendAssigner(
-        messages,
-        field_descriptor,
-        OffsetToSize(array.offsets),
-        lambda x: x,
-    )
-    for each_assigner, value in zip(assigner, ListValuesIterator(array)):
-        each_assigner(child)
+    # Flat list of the children, aligned with the values array
+    children = []
+    for message, size in zip(messages, OffsetToSize(array.offsets)):
+        if message is None:
+            children.extend(itertools.repeat(None, size))
+        elif size > 0:
+            add = getattr(message, field_descriptor.name).add
+            children.extend(add() for _ in range(size))
     _extract_array_messages(
         offset_values_array(array, array.values),
         field_descriptor.message_type,
-        RepeatedNestedIterable(messages, field_descriptor),
+        children,
     )
 
 
+def _extract_date_field(
+    array: pa.Array, field_descriptor: FieldDescriptor, messages: Iterable[Message]
+) -> None:
+    years, months, days = _date32_to_civil(array)
+    for message, year, month, day in zip(messages, years, months, days):
+        if year is not None and message is not None:
+            date = getattr(message, field_descriptor.name)
+            date.SetInParent()
+            date.year = year
+            date.month = month
+            date.day = day
+
+
+def _extract_temporal_field(
+    array: pa.Array, field_descriptor: FieldDescriptor, messages: Iterable[Message]
+) -> None:
+    components = _temporal_to_components(array, field_descriptor.message_type)
+    if field_descriptor.message_type == TimeOfDay.DESCRIPTOR:
+        for message, hours, minutes, seconds, nanos in zip(
+            messages, *components.values()
+        ):
+            if hours is not None and message is not None:
+                time_of_day = getattr(message, field_descriptor.name)
+                time_of_day.SetInParent()
+                time_of_day.hours = hours
+                time_of_day.minutes = minutes
+                time_of_day.seconds = seconds
+                time_of_day.nanos = nanos
+    else:
+        for message, seconds, nanos in zip(messages, *components.values()):
+            if seconds is not None and message is not None:
+                value = getattr(message, field_descriptor.name)
+                value.SetInParent()
+                value.seconds = seconds
+                value.nanos = nanos
+
+
 def _extract_field(
     array: pa.Array, field_descriptor: FieldDescriptor, messages: Iterable[Message]
 ) -> None:
     if field_descriptor.is_repeated:
         _extract_repeated_field(array, field_descriptor, messages)
+    elif field_descriptor.message_type == Date.DESCRIPTOR:
+        _extract_date_field(array, field_descriptor, messages)
     elif field_descriptor.message_type in TEMPORAL_CONVERTERS:
-        extractor = TEMPORAL_CONVERTERS[field_descriptor.message_type](array.type)
-        for message, value in zip(messages, array):
-            if value.is_valid and message is not None:
-                getattr(
-                    message,
-                    field_descriptor.name,
-                ).MergeFrom(extractor(value))
+        _extract_temporal_field(array, field_descriptor, messages)
     elif (
         field_descriptor.type == FieldDescriptor.TYPE_MESSAGE
         and field_descriptor.message_type not in NULLABLE_TYPES
     ):
         _extract_struct_field(array, field_descriptor, messages)
     else:
-        plain_assigner = PlainAssigner(messages, field_descriptor, array.type)
-        for plain_assigner, value in zip(plain_assigner, array):
-            if value.is_valid:
-                plain_assigner(value)
+        for plain_assigner, value in zip(
+            PlainAssigner(messages, field_descriptor),
+            _array_to_values(array, field_descriptor),
+        ):
+            plain_assigner(value)
 
 
 def _extract_record_batch_messages(
@@ -664,8 +736,193 @@ def record_batch_to_messages(
     return messages
 
 
-def table_to_messages(table: pa.Table, message_type: Type[M]) -> List[M]:
-    messages = []
-    for batch in table.to_reader():
-        messages.extend(record_batch_to_messages(batch, message_type))
-    return messages
+class LazyMessageSequence(collections.abc.Sequence, Generic[M]):
+    """
+    Read-only sequence of messages, backed by a `pa.RecordBatch`
+
+    Messages are only converted when a row is accessed, `block_size` rows at
+    a time. At most `max_cached_blocks` blocks are kept, least recently used
+    first out. Cached messages are shared between accesses, so modifying a
+    message returned by the sequence is visible until its block is evicted.
+    """
+
+    def __init__(
+        self,
+        record_batch: pa.RecordBatch,
+        message_type: Type[M],
+        block_size: int = 1_024,
+        max_cached_blocks: int = 16,
+    ):
+        if block_size <= 0:
+            raise ValueError(f"block_size must be positive, got {block_size}")
+        if max_cached_blocks <= 0:
+            raise ValueError(
+                f"max_cached_blocks must be positive, got {max_cached_blocks}"
+            )
+        self._record_batch = record_batch
+        self._message_type = message_type
+        self._block_size = block_size
+        self._max_cached_blocks = max_cached_blocks
+        self._blocks: "collections.OrderedDict[int, List[M]]" = (
+            collections.OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return self._record_batch.num_rows
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[M, List[M]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("LazyMessageSequence index out of range")
+        block_index, offset = divmod(index, self._block_size)
+        return self._get_block(block_index)[offset]
+
+    def __iter__(self) -> Iterator[M]:
+        for block_index in range(0, -(-len(self) // self._block_size)):
+            yield from self._get_block(block_index)
+
+    def _get_block(self, block_index: int) -> List[M]:
+        block = self._blocks.get(block_index)
+        if block is None:
+            block = record_batch_to_messages(
+                self._record_batch.slice(
+                    block_index * self._block_size, self._block_size
+                ),
+                self._message_type,
+            )
+            self._blocks[block_index] = block
+            if len(self._blocks) > self._max_cached_blocks:
+                self._blocks.popitem(last=False)
+        else:
+            self._blocks.move_to_end(block_index)
+        return block
+
+
+def record_batch_to_lazy_messages(
+    record_batch: pa.RecordBatch,
+    message_type: Type[M],
+    block_size: int = 1_024,
+    max_cached_blocks: int = 16,
+) -> LazyMessageSequence[M]:
+    """
+    Returns a `LazyMessageSequence` converting rows of `record_batch` on access
+
+    Useful when only some of the rows are looked at, for example after
+    filtering.
+    """
+    return LazyMessageSequence(
+        record_batch, message_type, block_size, max_cached_blocks
+    )
+
+
+def record_batch_to_serialized(
+    record_batch: pa.RecordBatch,
+    message_type: Type[Message],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> pa.BinaryArray:
+    """
+    Converts a `pa.RecordBatch` to serialized protobuf payloads
+
+    The output is identical to calling `SerializeToString` on each message.
+    Rows are converted `batch_size` at a time, so only that many messages
+    are held in memory at once.
+    """
+    if batch_size <= 0:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+    payloads = []
+    for offset in range(0, record_batch.num_rows, batch_size):
+        payloads.extend(
+            message.SerializeToString()
+            for message in record_batch_to_messages(
+                record_batch.slice(offset, batch_size), message_type
+            )
+        )
+    return pa.array(payloads, pa.binary())
+
+
+def _iter_record_batches(
+    source: Union[pa.Table, pa.RecordBatchReader, Any], batch_size: int
+) -> Iterator[pa.RecordBatch]:
+    if isinstance(source, pa.Table):
+        reader = source.to_reader(max_chunksize=batch_size)
+    elif isinstance(source, pa.RecordBatchReader):
+        reader = source
+    elif hasattr(source, "__arrow_c_stream__"):
+        reader = pa.RecordBatchReader.from_stream(source)
+    else:
+        raise TypeError(
+            "Expected a pa.Table, pa.RecordBatchReader or an object implementing"
+            f" __arrow_c_stream__, got {type(source).__name__}"
+        )
+    for record_batch in reader:
+        for offset in range(0, record_batch.num_rows, batch_size):
+            yield record_batch.slice(offset, batch_size)
+
+
+def iter_table_messages(
+    source: Union[pa.Table, pa.RecordBatchReader, Any],
+    message_type: Type[M],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[M]:
+    """
+    Lazily converts a table, or a stream of record batches, to protobuf messages
+
+    The source can be a `pa.Table`, a `pa.RecordBatchReader` or any object
+    implementing `__arrow_c_stream__`. Record batches are converted
+    `batch_size` rows at a time, so only that many messages are held in memory.
+    """
+    if batch_size <= 0:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+    for record_batch in _iter_record_batches(source, batch_size):
+        yield from record_batch_to_messages(record_batch, message_type)
+
+
+def _ipc_to_serialized(
+    file_descriptor_set: bytes, full_name: str, buffer: pa.Buffer
+) -> pa.BinaryArray:
+    return record_batch_to_serialized(
+        ipc_to_record_batch(buffer), get_message_class(file_descriptor_set, full_name)
+    )
+
+
+def table_to_messages(
+    table: pa.Table,
+    message_type: Type[M],
+    workers: Optional[int] = None,
+    batch_size: Optional[int] = None,
+) -> List[M]:
+    """
+    Converts a `pa.Table` to a list of protobuf messages
+
+    When `workers` is set, chunks of `batch_size` rows (by default, one chunk
+    per worker) are converted in a pool of processes, which send back
+    serialized messages, parsed in order in the calling process.
+    """
+    if workers is None:
+        return list(
+            iter_table_messages(table, message_type, batch_size or DEFAULT_BATCH_SIZE)
+        )
+
+    check_workers(workers)
+    if batch_size is None:
+        batch_size = max(-(-table.num_rows // workers), 1)
+    elif batch_size <= 0:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+    file_descriptor_set = get_file_descriptor_set(message_type.DESCRIPTOR)
+    tasks = [
+        (
+            file_descriptor_set,
+            message_type.DESCRIPTOR.full_name,
+            record_batch_to_ipc(record_batch),
+        )
+        for record_batch in _iter_record_batches(table, batch_size)
+    ]
+    from_string = message_type.FromString
+    return [
+        from_string(payload)
+        for payloads in map_in_processes(_ipc_to_serialized, tasks, workers)
+        for payload in payloads.to_pylist()
+    ]
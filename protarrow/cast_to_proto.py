@@ -1,3 +1,4 @@
+import concurrent.futures
 from typing import Any, Optional, Tuple, Type
 
 import pyarrow as pa
@@ -19,6 +20,7 @@ from protarrow.proto_to_arrow import (
     _PROTO_PRIMITIVE_TYPE_TO_PYARROW,
     _map_as_list_from_arrays,
     field_descriptor_to_field,
+    get_enum_dictionary,
     get_map_descriptors,
     is_map,
     message_type_to_schema,
@@ -46,6 +48,23 @@ def get_arrow_default_value(
         return field_descriptor.default_value
 
 
+def _dictionary_encode_enum(
+    array: pa.Array, field_descriptor: FieldDescriptor, enum_type: pa.DataType
+) -> pa.DictionaryArray:
+    """Encode against the same dictionary as `messages_to_record_batch`"""
+    _, dictionary = get_enum_dictionary(
+        field_descriptor.enum_type, enum_type.value_type
+    )
+    indices = pc.index_in(array, value_set=dictionary)
+    if indices.null_count > array.null_count:
+        # Preserve names that aren't in the enum
+        return pc.dictionary_encode(array)
+    else:
+        return pa.DictionaryArray.from_arrays(
+            indices.cast(enum_type.index_type), dictionary
+        )
+
+
 def _cast_to_message_type(
     array: pa.Array,
     field_descriptor: FieldDescriptor,
@@ -84,7 +103,11 @@ def _cast_flat_array(
             if pa.types.is_dictionary(config.enum_type) and not pa.types.is_dictionary(
                 array.type
             ):
-                results = pc.dictionary_encode(array.cast(config.enum_type.value_type))
+                results = _dictionary_encode_enum(
+                    array.cast(config.enum_type.value_type),
+                    field_descriptor,
+                    config.enum_type,
+                )
                 assert results.type == config.enum_type
             else:
                 results = array.cast(config.enum_type)
@@ -241,16 +264,37 @@ def cast_struct_array(
 
 
 def cast_table(
-    table: pa.Table, message_type: Type[Message], config: ProtarrowConfig
+    table: pa.Table,
+    message_type: Type[Message],
+    config: ProtarrowConfig,
+    use_threads: bool = False,
+    max_workers: Optional[int] = None,
 ) -> pa.Table:
+    """
+    Casts a `pa.Table` to the schema of `message_type`
+
+    With `use_threads`, record batches are cast concurrently in a pool of
+    `max_workers` threads (most of the work is in arrow, which releases the GIL),
+    and kept in their original order.
+    """
     proto_schema = message_type_to_schema(message_type, config)
-    return pa.Table.from_batches(
-        [
+    record_batches = table.to_batches()
+    if use_threads and len(record_batches) > 1:
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            casted = list(
+                executor.map(
+                    lambda record_batch: cast_record_batch(
+                        record_batch, message_type, config
+                    ),
+                    record_batches,
+                )
+            )
+    else:
+        casted = [
             cast_record_batch(record_batch, message_type, config)
-            for record_batch in table.to_reader()
-        ],
-        proto_schema,
-    )
+            for record_batch in record_batches
+        ]
+    return pa.Table.from_batches(casted, proto_schema)
 
 
 def maybe_copy_offsets(offsets: pa.Array) -> pa.Array:
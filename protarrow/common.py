@@ -2,12 +2,19 @@ import dataclasses
 from typing import Optional, TypeVar, Union
 
 import pyarrow as pa
+import pyarrow.compute as pc
 from google.protobuf.message import Message
 
 M = TypeVar("M", bound=Message)
 
 _INVALID_DATE_SENTINEL = -719163
 
+DEFAULT_BATCH_SIZE = 65_536
+
+# Same range as google.protobuf.internal.well_known_types._CheckTimestampValid
+_TIMESTAMP_SECONDS_MIN = -62135596800
+_TIMESTAMP_SECONDS_MAX = 253402300799
+
 SUPPORTED_ENUM_TYPES = (
     pa.int32(),
     pa.binary(),
@@ -62,6 +69,7 @@ class ProtarrowConfig:
     list_array_type: type = pa.ListArray
     skip_recursive_messages: bool = False
     map_as_list: bool = False
+    single_pass: bool = False
 
     def __post_init__(self):
         _validate_enum_type(self.enum_type, self.string_type, self.binary_type)
@@ -123,8 +131,31 @@ def is_string_enum(data_type: pa.DataType) -> bool:
 def offset_values_array(
     array: Union[pa.ListArray, pa.MapArray], values_array: pa.Array
 ) -> pa.Array:
-    """Apply the ListArray/MapArray offset to its child value array"""
-    if array.offset == 0 or len(array.offsets) == 0:
+    """Restrict the child value array to the values of the ListArray/MapArray slice"""
+    if len(array.offsets) == 0:
         return values_array
     else:
-        return values_array[array.offsets[0].as_py() :]
+        first = array.offsets[0].as_py()
+        last = array.offsets[-1].as_py()
+        if first == 0 and last == len(values_array):
+            return values_array
+        return values_array[first:last]
+
+
+def _check_range(array: pa.Array, low: int, high: int, message: str) -> None:
+    min_max = pc.min_max(array)
+    min_value = min_max["min"].as_py()
+    max_value = min_max["max"].as_py()
+    if min_value is not None and (min_value < low or max_value > high):
+        raise ValueError(message)
+
+
+def check_timestamp_seconds(seconds: pa.Array) -> None:
+    """Raise like `Timestamp.FromSeconds` if some seconds are out of range"""
+    _check_range(
+        seconds,
+        _TIMESTAMP_SECONDS_MIN,
+        _TIMESTAMP_SECONDS_MAX,
+        "Timestamp is not valid: Seconds must be in range "
+        f"[{_TIMESTAMP_SECONDS_MIN}, {_TIMESTAMP_SECONDS_MAX}].",
+    )
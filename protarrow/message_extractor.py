@@ -1,14 +1,34 @@
-from typing import Any, Callable, Dict, Generic, List, Type, TypeVar, Union
+import collections
+import dataclasses
+import weakref
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import pyarrow as pa
+import pyarrow.compute as pc
 from google.protobuf.descriptor import Descriptor, FieldDescriptor
 from google.protobuf.message import Message
 
-from protarrow.arrow_to_proto import NULLABLE_TYPES, get_converter
+from protarrow.arrow_to_proto import NULLABLE_TYPES, get_converter, table_to_messages
 from protarrow.proto_to_arrow import get_map_descriptors, is_map
 
 M = TypeVar("M", bound=Message)
 
+# Number of tables for which a MessageExtractor keeps the columns it reads
+_MAX_CACHED_TABLES = 16
+
 
 class StructScalarConverter:
     def __init__(self, struct_type: pa.StructType, descriptor: Descriptor):
@@ -141,8 +161,28 @@ def get_field_converter(
             return get_flat_field_converter(field.type, field_descriptor)
 
 
+@dataclasses.dataclass(frozen=True)
+class CacheInfo:
+    """Statistics of the row cache of a `MessageExtractor`"""
+
+    hits: int
+    misses: int
+    evictions: int
+    max_size: int
+    size: int
+
+
 class MessageExtractor(Generic[M]):
-    def __init__(self, schema: pa.Schema, message_type: Type[M]):
+    """
+    Reads protobuf messages from rows of tables matching `schema`
+
+    When `cache_size` is positive, the last `cache_size` rows read with
+    `read_table_row` (or `lookup`) are cached, and copies are returned on hits.
+    """
+
+    def __init__(self, schema: pa.Schema, message_type: Type[M], cache_size: int = 0):
+        if cache_size < 0:
+            raise ValueError(f"cache_size must be positive or 0, got {cache_size}")
         descriptor = message_type.DESCRIPTOR
         self._extractors = {
             schema.get_field_index(field_descriptor.name): get_field_converter(
@@ -151,12 +191,167 @@ class MessageExtractor(Generic[M]):
             for field_descriptor in descriptor.fields
             if schema.get_field_index(field_descriptor.name) >= 0
         }
+        self._field_names = [schema.field(index).name for index in self._extractors]
         self._message_type = message_type
+        # id of the table -> (reference to the table, columns to read)
+        self._columns: collections.OrderedDict = collections.OrderedDict()
+        self._indexed_table: Optional[pa.Table] = None
+        self._key_columns: Tuple[str, ...] = ()
+        self._index: Dict[Any, int] = {}
+        self._cache_size = cache_size
+        # (id of the table, row) -> (reference to the table, message)
+        self._cache: collections.OrderedDict = collections.OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _get_columns(self, table: pa.Table) -> List[pa.ChunkedArray]:
+        """
+        The columns of `table` to read, kept for the last tables read
+
+        Arrow locates the chunk of a row with the chunk offsets of the column,
+        which it computes once, so only the columns need to be kept.
+        """
+        key = id(table)
+        entry = self._columns.get(key)
+        # The id of a table can be reused once it's garbage collected
+        if entry is None or entry[0]() is not table:
+            entry = (
+                weakref.ref(table),
+                [table.column(index) for index in self._extractors],
+            )
+            self._columns[key] = entry
+            if len(self._columns) > _MAX_CACHED_TABLES:
+                self._columns.popitem(last=False)
+        self._columns.move_to_end(key)
+        return entry[1]
 
     def read_table_row(self, table: pa.Table, row: int) -> M:
+        if self._cache_size == 0:
+            return self._convert_row(table, row)
+        if row < 0:
+            row += table.num_rows
+        key = (id(table), row)
+        entry = self._cache.get(key)
+        # The id of a table can be reused once it's garbage collected
+        if entry is not None and entry[0]() is table:
+            self._hits += 1
+            self._cache.move_to_end(key)
+            message = self._message_type()
+            message.CopyFrom(entry[1])
+            return message
+        self._misses += 1
+        message = self._convert_row(table, row)
+        self._cache[key] = (weakref.ref(table), message)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+            self._evictions += 1
+        copy = self._message_type()
+        copy.CopyFrom(message)
+        return copy
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(
+            self._hits,
+            self._misses,
+            self._evictions,
+            self._cache_size,
+            len(self._cache),
+        )
+
+    def invalidate_cache(self, table: Optional[pa.Table] = None) -> None:
+        """Drop the cached rows of `table`, or of all tables"""
+        if table is None:
+            self._cache.clear()
+        else:
+            for key in [key for key in self._cache if key[0] == id(table)]:
+                del self._cache[key]
+
+    def _convert_row(self, table: pa.Table, row: int) -> M:
+        if not -table.num_rows <= row < table.num_rows:
+            raise IndexError("index out of bounds")
         results = {}
-        for index, converter in self._extractors.items():
-            scalar = table.column(index)[row]
+        for name, converter, column in zip(
+            self._field_names, self._extractors.values(), self._get_columns(table)
+        ):
+            scalar = column[row]
             if scalar.is_valid:
-                results[table.schema.field(index).name] = converter(scalar)
+                results[name] = converter(scalar)
         return self._message_type(**results)
+
+    def read_table_rows(
+        self, table: pa.Table, indices: Union[Sequence[int], pa.Array]
+    ) -> List[M]:
+        """Read the messages at `indices`, in that order, converting in bulk"""
+        indices = pa.array(indices, pa.int64())
+        indices = pc.if_else(
+            pc.less(indices, 0), pc.add(indices, table.num_rows), indices
+        )
+        return table_to_messages(
+            table.select(list(self._extractors)).take(indices), self._message_type
+        )
+
+    def read_table_range(self, table: pa.Table, start: int, stop: int) -> List[M]:
+        """Read the messages from row `start` to `stop` (excluded), in bulk"""
+        start, stop, _ = slice(start, stop).indices(table.num_rows)
+        return table_to_messages(
+            table.select(list(self._extractors)).slice(start, max(stop - start, 0)),
+            self._message_type,
+        )
+
+    def index_table(self, table: pa.Table, key_columns: Sequence[str]) -> None:
+        """
+        Index the rows of `table` by the values of `key_columns`, for `lookup`
+
+        Keys are the value of the column, or a tuple of values for many columns.
+        When a key is repeated, the last row wins.
+        """
+        if isinstance(key_columns, str) or len(key_columns) == 0:
+            raise ValueError(f"key_columns must be a non-empty list, got {key_columns}")
+        for key_column in key_columns:
+            if table.schema.get_field_index(key_column) < 0:
+                raise ValueError(f"Key column {key_column} not found in table")
+        if self._indexed_table is not None:
+            self.invalidate_cache(self._indexed_table)
+        self._indexed_table = table.slice(0, 0)
+        self._key_columns = tuple(key_columns)
+        self._index = {}
+        self.append_batches(table.to_batches())
+
+    def _get_indexed_table(self) -> pa.Table:
+        if self._indexed_table is None:
+            raise ValueError("No table indexed, call index_table first")
+        return self._indexed_table
+
+    def append_batches(self, record_batches: Iterable[pa.RecordBatch]) -> None:
+        """Append record batches to the indexed table, indexing only the new rows"""
+        indexed_table = self._get_indexed_table()
+        new_rows = pa.Table.from_batches(list(record_batches), indexed_table.schema)
+        start = indexed_table.num_rows
+        columns = [new_rows.column(name).to_pylist() for name in self._key_columns]
+        keys = columns[0] if len(columns) == 1 else zip(*columns)
+        self._index.update(zip(keys, range(start, start + new_rows.num_rows)))
+        self.invalidate_cache(indexed_table)
+        self._indexed_table = pa.concat_tables([indexed_table, new_rows])
+
+    def lookup(self, key: Any) -> Optional[M]:
+        """The message of the indexed table with the given key, if any"""
+        indexed_table = self._get_indexed_table()
+        row = self._index.get(key)
+        if row is None:
+            return None
+        else:
+            return self.read_table_row(indexed_table, row)
+
+    def lookup_many(self, keys: Iterable[Any]) -> List[Optional[M]]:
+        """The messages of the indexed table with the given keys, in bulk"""
+        indexed_table = self._get_indexed_table()
+        rows = [self._index.get(key) for key in keys]
+        found = iter(
+            self.read_table_rows(
+                indexed_table,
+                pa.array([row for row in rows if row is not None], pa.int64()),
+            )
+        )
+        return [None if row is None else next(found) for row in rows]
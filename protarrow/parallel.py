@@ -0,0 +1,96 @@
+"""
+Helpers to run conversions in worker processes
+
+Message classes can't be pickled, so the message type is shipped to the
+workers as a serialized `FileDescriptorSet`, and record batches are shipped
+back and forth using the arrow IPC stream format.
+"""
+
+import concurrent.futures
+import functools
+from typing import Callable, Iterable, List, Sequence, Type, TypeVar
+
+import pyarrow as pa
+from google.protobuf import descriptor_pool, message_factory
+from google.protobuf.descriptor import Descriptor, FileDescriptor
+from google.protobuf.descriptor_pb2 import FileDescriptorProto, FileDescriptorSet
+from google.protobuf.message import Message
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _add_file(
+    file_descriptor: FileDescriptor,
+    file_descriptor_set: FileDescriptorSet,
+    seen: set,
+) -> None:
+    if file_descriptor.name in seen:
+        return
+    seen.add(file_descriptor.name)
+    for dependency in file_descriptor.dependencies:
+        _add_file(dependency, file_descriptor_set, seen)
+    file_descriptor.CopyToProto(file_descriptor_set.file.add())
+
+
+@functools.lru_cache(maxsize=None)
+def get_file_descriptor_set(descriptor: Descriptor) -> bytes:
+    """Serialized `FileDescriptorSet` of a message, dependencies first"""
+    file_descriptor_set = FileDescriptorSet()
+    _add_file(descriptor.file, file_descriptor_set, set())
+    return file_descriptor_set.SerializeToString()
+
+
+@functools.lru_cache(maxsize=None)
+def get_message_class(file_descriptor_set: bytes, full_name: str) -> Type[Message]:
+    """
+    Resolves a message class from a serialized `FileDescriptorSet`
+
+    Files are added to the default pool, unless already there, so well known
+    types resolve to the same descriptors as in the parent process.
+    """
+    pool = descriptor_pool.Default()
+    for file_descriptor_proto in FileDescriptorSet.FromString(file_descriptor_set).file:
+        _add_to_pool(pool, file_descriptor_proto)
+    return message_factory.GetMessageClass(pool.FindMessageTypeByName(full_name))
+
+
+def _add_to_pool(
+    pool: descriptor_pool.DescriptorPool, file_descriptor_proto: FileDescriptorProto
+) -> None:
+    try:
+        pool.FindFileByName(file_descriptor_proto.name)
+    except KeyError:
+        pool.AddSerializedFile(file_descriptor_proto.SerializeToString())
+
+
+def record_batch_to_ipc(record_batch: pa.RecordBatch) -> pa.Buffer:
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, record_batch.schema) as writer:
+        writer.write_batch(record_batch)
+    return sink.getvalue()
+
+
+def ipc_to_record_batch(buffer: pa.Buffer) -> pa.RecordBatch:
+    with pa.ipc.open_stream(buffer) as reader:
+        return reader.read_next_batch()
+
+
+def split(values: Sequence[T], shards: int) -> List[Sequence[T]]:
+    """Splits `values` in up to `shards` contiguous slices of similar size"""
+    size = max(-(-len(values) // shards), 1)
+    return [values[i : i + size] for i in range(0, len(values), size)]
+
+
+def map_in_processes(
+    function: Callable[..., R], tasks: Iterable[tuple], workers: int
+) -> List[R]:
+    """Runs `function` on each task in a pool of processes, keeping task order"""
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(function, *task) for task in tasks]
+        return [future.result() for future in futures]
+
+
+def check_workers(workers: int) -> None:
+    if workers <= 0:
+        raise ValueError(f"workers must be positive, got {workers}")
@@ -1,10 +1,14 @@
+import array
 import collections.abc
 import dataclasses
 import datetime
+import functools
+import itertools
 import operator
 from typing import (
     Any,
     Callable,
+    Dict,
     Iterable,
     Iterator,
     List,
@@ -39,11 +43,27 @@ from google.type.timeofday_pb2 import TimeOfDay
 
 from protarrow.common import (
     _INVALID_DATE_SENTINEL,
+    DEFAULT_BATCH_SIZE,
     M,
     ProtarrowConfig,
+    _check_range,
+    _is_any_binary,
+    check_timestamp_seconds,
     is_binary_enum,
     is_string_enum,
 )
+from protarrow.parallel import (
+    check_workers,
+    get_file_descriptor_set,
+    get_message_class,
+    ipc_to_record_batch,
+    map_in_processes,
+    record_batch_to_ipc,
+    split,
+)
+
+# Selected fields of a message, and for each the selected nested fields (or None)
+Projection = Tuple[Tuple[str, Optional["Projection"]], ...]
 
 _PROTO_DESCRIPTOR_TO_PYARROW = {
     BoolValue.DESCRIPTOR: pa.bool_(),
@@ -72,6 +92,20 @@ _PROTO_PRIMITIVE_TYPE_TO_PYARROW = {
     FieldDescriptorProto.TYPE_UINT64: pa.uint64(),
 }
 
+# Array typecodes used to collect repeated primitives in bulk
+_PYARROW_TO_TYPECODE = {
+    data_type: typecode
+    for data_type, typecode in (
+        (pa.float32(), "f"),
+        (pa.float64(), "d"),
+        (pa.int32(), "i"),
+        (pa.int64(), "q"),
+        (pa.uint32(), "I"),
+        (pa.uint64(), "Q"),
+    )
+    if array.array(typecode).itemsize == data_type.byte_width
+}
+
 
 def _time_of_day_to_nanos(time_of_day: TimeOfDay) -> int:
     return (
@@ -138,6 +172,218 @@ _DURATION_CONVERTERS = {
     "ns": Duration.ToNanoseconds,
 }
 
+_NANOS_PER_UNIT = {
+    "s": 1_000_000_000,
+    "ms": 1_000_000,
+    "us": 1_000,
+    "ns": 1,
+}
+_NANOS_MAX = 999_999_999
+
+
+@dataclasses.dataclass(frozen=True)
+class SecondsNanosArrayConverter:
+    """
+    Converts `Timestamp` or `Duration` messages to an array in one shot.
+
+    Gathers seconds and nanos in two int64 arrays and combines them with
+    arrow compute, instead of calling `ToNanoseconds` (and co) for every value.
+    """
+
+    data_type: pa.DataType
+    check_timestamp: bool
+
+    def __call__(
+        self,
+        values: Iterable[Optional[Message]],
+        validity_mask: Optional[Sequence[bool]],
+    ) -> pa.Array:
+        seconds = []
+        nanos = []
+        for i, record in enumerate(values):
+            if record is None or not (validity_mask is None or validity_mask[i]):
+                seconds.append(None)
+                nanos.append(None)
+            else:
+                seconds.append(record.seconds)
+                nanos.append(record.nanos)
+        seconds_array = pa.array(seconds, pa.int64())
+        nanos_array = pa.array(nanos, pa.int64())
+        if self.check_timestamp:
+            check_timestamp_seconds(seconds_array)
+            _check_range(
+                nanos_array,
+                0,
+                _NANOS_MAX,
+                "Timestamp is not valid: Nanos must be in range [0, 999999999].",
+            )
+        nanos_per_unit = _NANOS_PER_UNIT[self.data_type.unit]
+        if nanos_per_unit == _NANOS_PER_UNIT["s"]:
+            # Like ToSeconds, ignores nanos
+            array = seconds_array
+        else:
+            # Integer division truncates toward zero, like Duration.
+            # For Timestamp, nanos are positive so it is the same as flooring.
+            array = pc.add_checked(
+                pc.multiply_checked(
+                    seconds_array, _NANOS_PER_UNIT["s"] // nanos_per_unit
+                ),
+                pc.divide(nanos_array, nanos_per_unit),
+            )
+        return array.cast(self.data_type)
+
+
+def _civil_to_date32(
+    year: pa.Int64Array, month: pa.Int64Array, day: pa.Int64Array
+) -> pa.Array:
+    """
+    Vectorized conversion of year/month/day to days since epoch.
+
+    See http://howardhinnant.github.io/date_algorithms.html#days_from_civil.
+    Year 0 is converted to `_INVALID_DATE_SENTINEL`.
+    Only positive years are supported, so integer divisions are floor divisions.
+    """
+    _check_range(year, 0, 9999, "Date is not valid: Year must be in range [1, 9999].")
+    is_invalid = pc.equal(year, 0)
+    before_march = pc.less_equal(month, 2)
+    shifted_year = pc.subtract(year, before_march.cast(pa.int64()))
+    era = pc.divide(shifted_year, 400)
+    year_of_era = pc.subtract(shifted_year, pc.multiply(era, 400))
+    shifted_month = pc.if_else(before_march, pc.add(month, 9), pc.subtract(month, 3))
+    day_of_year = pc.add(
+        pc.divide(pc.add(pc.multiply(shifted_month, 153), 2), 5), pc.subtract(day, 1)
+    )
+    day_of_era = pc.add(
+        pc.subtract(
+            pc.add(pc.multiply(year_of_era, 365), pc.divide(year_of_era, 4)),
+            pc.divide(year_of_era, 100),
+        ),
+        day_of_year,
+    )
+    days = pc.subtract(pc.add(pc.multiply(era, 146_097), day_of_era), 719_468)
+    dates = (
+        pc.if_else(is_invalid, _INVALID_DATE_SENTINEL, days)
+        .cast(pa.int32())
+        .cast(pa.date32())
+    )
+    # Month and day out of range would silently roll over to another date
+    mismatch = pc.and_(
+        pc.invert(is_invalid),
+        pc.or_(
+            pc.not_equal(pc.day(dates), day),
+            pc.or_(
+                pc.not_equal(pc.month(dates), month),
+                pc.not_equal(pc.year(dates), year),
+            ),
+        ),
+    )
+    if pc.any(mismatch).as_py():
+        raise ValueError("Date is not valid: month or day out of range")
+    return dates
+
+
+@dataclasses.dataclass(frozen=True)
+class DateArrayConverter:
+    """Converts `Date` messages to a date32 array in one shot."""
+
+    def __call__(
+        self,
+        values: Iterable[Optional[Date]],
+        validity_mask: Optional[Sequence[bool]],
+    ) -> pa.Array:
+        years = []
+        months = []
+        days = []
+        for i, record in enumerate(values):
+            if record is None or not (validity_mask is None or validity_mask[i]):
+                years.append(None)
+                months.append(None)
+                days.append(None)
+            else:
+                years.append(record.year)
+                months.append(record.month)
+                days.append(record.day)
+        return _civil_to_date32(
+            pa.array(years, pa.int64()),
+            pa.array(months, pa.int64()),
+            pa.array(days, pa.int64()),
+        )
+
+
+def get_enum_dictionary(
+    enum_descriptor: EnumDescriptor, value_type: pa.DataType
+) -> Tuple[pa.Array, pa.Array]:
+    """
+    Return the numbers and names of the values of an enum, aligned.
+
+    The first value of the enum, used as a fallback for unknown values,
+    comes first. Aliases are skipped.
+    """
+    numbers = []
+    for enum_value in enum_descriptor.values:
+        if enum_value.number not in numbers:
+            numbers.append(enum_value.number)
+    names = [enum_descriptor.values_by_number[number].name for number in numbers]
+    if _is_any_binary(value_type):
+        names = [name.encode("utf-8") for name in names]
+    return pa.array(numbers, pa.int32()), pa.array(names, value_type)
+
+
+@dataclasses.dataclass(frozen=True)
+class EnumArrayConverter:
+    """
+    Converts enum values to string, binary or dictionary arrays in one shot.
+
+    Enum numbers are mapped to indices in a dictionary precomputed from the
+    `EnumDescriptor`, so names are not looked up, nor hashed, for every value.
+    Unknown values fall back to the first value of the enum.
+    """
+
+    data_type: pa.DataType
+    numbers: pa.Array
+    dictionary: pa.Array
+    null_number: Optional[int]
+
+    @staticmethod
+    def create(
+        data_type: pa.DataType,
+        enum_descriptor: EnumDescriptor,
+        null_number: Optional[int],
+    ) -> "EnumArrayConverter":
+        numbers, dictionary = get_enum_dictionary(
+            enum_descriptor,
+            (data_type.value_type if pa.types.is_dictionary(data_type) else data_type),
+        )
+        return EnumArrayConverter(data_type, numbers, dictionary, null_number)
+
+    def __call__(
+        self,
+        values: Iterable[Optional[int]],
+        validity_mask: Optional[Sequence[bool]],
+    ) -> pa.Array:
+        codes_array = pa.array(list(values), pa.int32())
+        if validity_mask is not None:
+            codes_array = pc.if_else(
+                pa.array(validity_mask, pa.bool_()),
+                codes_array,
+                pa.scalar(None, pa.int32()),
+            )
+        if self.null_number is not None and codes_array.null_count > 0:
+            codes_array = codes_array.fill_null(self.null_number)
+        indices = pc.index_in(codes_array, value_set=self.numbers)
+        if indices.null_count > codes_array.null_count:
+            indices = pc.if_else(
+                codes_array.is_valid(),
+                indices.fill_null(0),
+                pa.scalar(None, indices.type),
+            )
+        if pa.types.is_dictionary(self.data_type):
+            return pa.DictionaryArray.from_arrays(
+                indices.cast(self.data_type.index_type), self.dictionary
+            )
+        else:
+            return self.dictionary.take(indices)
+
 
 @dataclasses.dataclass(frozen=True)
 class FlattenedIterable(collections.abc.Iterable):
@@ -275,28 +521,7 @@ def field_descriptor_to_field(
         value_type = field_descriptor_to_data_type(
             value_field, config, descriptor_trace
         )
-        if config.map_as_list:
-            map_type = config.list_(
-                item_type=pa.struct(
-                    fields=[
-                        pa.field(
-                            name="key",
-                            type=key_type,
-                            nullable=False,
-                        ),
-                        pa.field(
-                            name=config.map_value_name,
-                            type=value_type,
-                            nullable=config.map_value_nullable,
-                        ),
-                    ]
-                )
-            )
-        else:
-            map_type = pa.map_(
-                key_type,
-                pa.field(config.map_value_name, value_type, config.map_value_nullable),
-            )
+        map_type = _map_data_type(key_type, value_type, config)
         return pa.field(
             field_descriptor.name,
             map_type,
@@ -414,45 +639,6 @@ def _get_converter(
         )
 
 
-def _proto_field_to_array(
-    proto_field_values: Iterable[Any],
-    field_descriptor: FieldDescriptor,
-    validity_mask: Optional[Sequence[bool]],
-    config: ProtarrowConfig,
-    descriptor_trace: Tuple[Descriptor, ...] = (),
-) -> pa.Array:
-    converter = _get_converter(field_descriptor, config)
-
-    if converter is not None:
-        data_type = field_descriptor_to_data_type(field_descriptor, config)
-        null_value = (
-            None
-            if (
-                field_descriptor.has_presence
-                # We use none for repeated field as there should not
-                # be any missing list elements, they are not nullable
-                or field_descriptor.is_repeated
-            )
-            else converter(field_descriptor.default_value)
-        )
-        array = []
-        for i, record in enumerate(proto_field_values):
-            if record is None or not (validity_mask is None or validity_mask[i]):
-                value = null_value
-            else:
-                value = converter(record)
-            array.append(value)
-        return pa.array(array, data_type)
-    else:
-        return _messages_to_array(
-            proto_field_values,
-            field_descriptor.message_type,
-            validity_mask=validity_mask,
-            config=config,
-            descriptor_trace=descriptor_trace,
-        )
-
-
 def _get_offsets(
     repeated_values: Iterable[Union[RepeatedScalarFieldContainer, MessageMap]],
 ) -> List[int]:
@@ -466,29 +652,31 @@ def _get_offsets(
     return offsets
 
 
-def _repeated_proto_to_array(
-    repeated_values: Iterable[RepeatedScalarFieldContainer],
-    field_descriptor: FieldDescriptor,
-    config: ProtarrowConfig,
-    descriptor_trace: Tuple[Descriptor, ...] = (),
-) -> pa.ListArray:
-    """
-    Convert Protobuf embedded lists to a 1-dimensional PyArrow ListArray with offsets
-    See PyArrow Layout format documentation on how to calculate offsets.
-    """
-    offsets = _get_offsets(repeated_values)
-    array = _proto_field_to_array(
-        FlattenedIterable(repeated_values),
-        field_descriptor,
-        None,
-        config,
-        descriptor_trace,
-    )
-    return config.list_array_type.from_arrays(
-        offsets,
-        array,
-        config.list_(array.type),
-    )
+def _map_data_type(
+    key_type: pa.DataType, value_type: pa.DataType, config: ProtarrowConfig
+) -> pa.DataType:
+    if config.map_as_list:
+        return config.list_(
+            item_type=pa.struct(
+                fields=[
+                    pa.field(
+                        name="key",
+                        type=key_type,
+                        nullable=False,
+                    ),
+                    pa.field(
+                        name=config.map_value_name,
+                        type=value_type,
+                        nullable=config.map_value_nullable,
+                    ),
+                ]
+            )
+        )
+    else:
+        return pa.map_(
+            key_type,
+            pa.field(config.map_value_name, value_type, config.map_value_nullable),
+        )
 
 
 def _map_as_list_from_arrays(
@@ -523,71 +711,7 @@ def _map_as_list_from_arrays(
                 ),
             ],
         ),
-    ).cast(
-        config.list_(
-            item_type=pa.struct(
-                fields=[
-                    pa.field(
-                        name="key",
-                        type=keys.type,
-                        nullable=False,
-                    ),
-                    pa.field(
-                        name=config.map_value_name,
-                        type=values.type,
-                        nullable=config.map_value_nullable,
-                    ),
-                ]
-            )
-        )
-    )
-
-
-def _proto_map_to_array(
-    maps: Iterable[MessageMap],
-    field_descriptor: FieldDescriptor,
-    config: ProtarrowConfig = ProtarrowConfig(),
-    descriptor_trace: Tuple[Descriptor, ...] = (),
-) -> pa.MapArray:
-    """
-    Convert Protobuf maps to a 1-dimensional PyArrow MapArray with offsets
-    See PyArrow Layout format documentation on how to calculate offsets.
-    """
-    key_field = field_descriptor.message_type.fields_by_name["key"]
-    value_field = field_descriptor.message_type.fields_by_name["value"]
-    offsets = _get_offsets(maps)
-    keys = _proto_field_to_array(
-        MapKeyIterable(maps),
-        key_field,
-        validity_mask=None,
-        config=config,
-    )
-    values = _proto_field_to_array(
-        MapValueIterable(maps),
-        value_field,
-        validity_mask=None,
-        config=config,
-        descriptor_trace=descriptor_trace,
-    )
-    if config.map_as_list:
-        array = _map_as_list_from_arrays(
-            offsets=offsets,
-            keys=keys,
-            values=values,
-            config=config,
-        )
-    else:
-        array = pa.MapArray.from_arrays(offsets, keys, values).cast(
-            pa.map_(
-                keys.type,
-                pa.field(
-                    config.map_value_name,
-                    values.type,
-                    nullable=config.map_value_nullable,
-                ),
-            )
-        )
-    return array
+    ).cast(_map_data_type(keys.type, values.type, config))
 
 
 def _proto_field_nullable(
@@ -616,89 +740,675 @@ def _proto_field_validity_mask(
     return mask
 
 
-def _messages_to_array(
-    messages: Iterable[Message],
-    descriptor: Descriptor,
-    validity_mask: Optional[Sequence[bool]],
-    config: ProtarrowConfig,
-    descriptor_trace: Tuple[Descriptor, ...] = (),
-) -> pa.StructArray:
-    arrays = []
-    fields = []
-
-    for field_descriptor in descriptor.fields:
-        if (
-            field_descriptor.type == FieldDescriptor.TYPE_MESSAGE
-            and not field_descriptor.is_repeated
-        ):
-            field_values = NestedIterable(
-                messages, NestedMessageGetter(field_descriptor.name)
-            )
+@dataclasses.dataclass(frozen=True)
+class ValuePlan:
+    """
+    Pre-resolved conversion of the values of a field to an array.
+
+    For repeated fields and maps, this applies to the flattened values.
+    """
+
+    field_descriptor: FieldDescriptor
+    data_type: pa.DataType
+    converter: Optional[Callable[[Any], Any]]
+    null_value: Any
+    message_plan: Optional["ProtoToArrowPlan"]
+    array_converter: Optional[
+        Callable[[Iterable[Any], Optional[Sequence[bool]]], pa.Array]
+    ] = None
+    typecode: Optional[str] = None
+
+    def to_array(
+        self,
+        values: Iterable[Any],
+        validity_mask: Optional[Sequence[bool]],
+    ) -> pa.Array:
+        if self.message_plan is not None:
+            return self.message_plan.to_array(values, validity_mask)
+        if self.array_converter is not None:
+            return self.array_converter(values, validity_mask)
+        converter = self.converter
+        null_value = self.null_value
+        array = []
+        for i, record in enumerate(values):
+            if record is None or not (validity_mask is None or validity_mask[i]):
+                value = null_value
+            else:
+                value = converter(record)
+            array.append(value)
+        return pa.array(array, self.data_type)
+
+    def buffer_to_array(self, buffer: array.array) -> pa.Array:
+        """Wrap a buffer of primitive values, as collected for `typecode`"""
+        return pa.Array.from_buffers(
+            self.data_type, len(buffer), [None, pa.py_buffer(buffer)]
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class FieldPlan:
+    """Pre-resolved conversion of a field of a message to an array."""
+
+    field_descriptor: FieldDescriptor
+    field: pa.Field
+    getter: Callable[[Message], Any]
+    value_plan: ValuePlan
+    key_plan: Optional[ValuePlan]
+    config: ProtarrowConfig
+
+    def to_array(self, messages: Iterable[Optional[Message]]) -> pa.Array:
+        field_values = NestedIterable(messages, self.getter)
+        if self.key_plan is not None:
+            return self.map_to_array(field_values)
+        elif self.field_descriptor.is_repeated:
+            return self.repeated_to_array(field_values)
         else:
-            field_values = NestedIterable(
-                messages, operator.attrgetter(field_descriptor.name)
+            return self.value_plan.to_array(
+                field_values,
+                _proto_field_validity_mask(messages, self.field_descriptor),
             )
 
-        this_trace = descriptor_trace + (descriptor,)
-        if descriptor in descriptor_trace:
-            if config.skip_recursive_messages:
-                continue
+    def repeated_to_array(
+        self, repeated_values: Iterable[RepeatedScalarFieldContainer]
+    ) -> pa.Array:
+        """
+        Convert Protobuf embedded lists to a 1-dimensional PyArrow ListArray
+        See PyArrow Layout format documentation on how to calculate offsets.
+        """
+        if self.value_plan.typecode is not None:
+            return self._repeated_primitive_to_array(repeated_values)
+        return self.list_from_arrays(
+            _get_offsets(repeated_values),
+            self.value_plan.to_array(FlattenedIterable(repeated_values), None),
+        )
+
+    def _repeated_primitive_to_array(
+        self, repeated_values: Iterable[RepeatedScalarFieldContainer]
+    ) -> pa.Array:
+        """Extend a typed buffer with each container, no per element call"""
+        buffer = array.array(self.value_plan.typecode)
+        lengths = []
+        for record in repeated_values:
+            if record is None:
+                lengths.append(0)
             else:
-                _raise_recursion_error(this_trace)
+                buffer.extend(record)
+                lengths.append(len(record))
+        return self.list_from_arrays(
+            list(itertools.accumulate(lengths, initial=0)),
+            self.value_plan.buffer_to_array(buffer),
+        )
+
+    def map_to_array(self, maps: Iterable[MessageMap]) -> pa.Array:
+        """
+        Convert Protobuf maps to a 1-dimensional PyArrow MapArray with offsets
+        See PyArrow Layout format documentation on how to calculate offsets.
+        """
+        return self.map_from_arrays(
+            _get_offsets(maps),
+            self.key_plan.to_array(MapKeyIterable(maps), None),
+            self.value_plan.to_array(MapValueIterable(maps), None),
+        )
 
-        if is_map(field_descriptor):
-            array = _proto_map_to_array(
-                field_values, field_descriptor, config, this_trace
+    def list_from_arrays(self, offsets: List[int], values: pa.Array) -> pa.Array:
+        return self.config.list_array_type.from_arrays(offsets, values, self.field.type)
+
+    def map_from_arrays(
+        self, offsets: List[int], keys: pa.Array, values: pa.Array
+    ) -> pa.Array:
+        if self.config.map_as_list:
+            return _map_as_list_from_arrays(
+                offsets=offsets,
+                keys=keys,
+                values=values,
+                config=self.config,
             )
-        elif field_descriptor.is_repeated:
-            array = _repeated_proto_to_array(
-                field_values, field_descriptor, config, this_trace
+        else:
+            return pa.MapArray.from_arrays(offsets, keys, values).cast(self.field.type)
+
+
+@dataclasses.dataclass(frozen=True)
+class ProtoToArrowPlan:
+    """
+    Conversion of messages to arrow, compiled for a message type and a config.
+
+    All the converters, arrow types, nullability and metadata are resolved once,
+    when the plan is built, instead of on every conversion.
+    """
+
+    descriptor: Descriptor
+    config: ProtarrowConfig
+    field_plans: Tuple[FieldPlan, ...]
+    struct_type: pa.StructType
+
+    def to_array(
+        self,
+        messages: Iterable[Optional[Message]],
+        validity_mask: Optional[Sequence[bool]],
+    ) -> pa.StructArray:
+        arrays = [field_plan.to_array(messages) for field_plan in self.field_plans]
+        if validity_mask is not None:
+            mask = pc.invert(pa.array(validity_mask, pa.bool_()))
+        elif len(arrays) == 0:
+            # This only happens when using empty messages.
+            mask = pa.repeat(False, len(messages))  # type: ignore[arg-type]
+        else:
+            mask = None
+        return pa.StructArray.from_arrays(
+            arrays=arrays,
+            fields=list(self.struct_type),
+            mask=mask,
+        )
+
+    def to_record_batch(self, messages: Iterable[Message]) -> pa.RecordBatch:
+        if self.config.single_pass:
+            builder = _MessageBuilder(self)
+            for message in messages:
+                builder.append(message)
+            array = builder.finish()
+        else:
+            array = self.to_array(messages, None)
+        return pa.RecordBatch.from_struct_array(array)
+
+
+class _ValueBuilder(list):
+    """Accumulates raw values, converted to an array once all are collected"""
+
+    def __init__(self, value_plan: ValuePlan):
+        super().__init__()
+        self.value_plan = value_plan
+
+    def pad(self, count: int) -> None:
+        self.extend([None] * count)
+
+    def finish(self) -> pa.Array:
+        return self.value_plan.to_array(self, None)
+
+
+class _MessageBuilder:
+    """
+    Accumulates messages row by row, in a single pass.
+
+    Only the fields that are set (as returned by `ListFields`) are visited.
+    Fields that are not set are padded with their default, in bulk, when the
+    next value is appended or when the array is finished.
+    """
+
+    def __init__(self, plan: ProtoToArrowPlan):
+        self.plan = plan
+        self.validity = []
+        self.field_builders = [
+            _FieldBuilder.create(field_plan) for field_plan in plan.field_plans
+        ]
+        self.builders_by_descriptor = {
+            field_builder.field_plan.field_descriptor: field_builder
+            for field_builder in self.field_builders
+        }
+
+    def __len__(self) -> int:
+        return len(self.validity)
+
+    def append(self, message: Optional[Message]) -> None:
+        if message is None:
+            self.validity.append(False)
+        else:
+            row = len(self.validity)
+            self.validity.append(True)
+            builders_by_descriptor = self.builders_by_descriptor
+            for field_descriptor, value in message.ListFields():
+                field_builder = builders_by_descriptor.get(field_descriptor)
+                if field_builder is not None:
+                    field_builder.append(row, value)
+
+    def extend(self, messages: Iterable[Message]) -> None:
+        for message in messages:
+            self.append(message)
+
+    def pad(self, count: int) -> None:
+        self.validity.extend([False] * count)
+
+    def finish(self) -> pa.StructArray:
+        length = len(self.validity)
+        arrays = [field_builder.finish(length) for field_builder in self.field_builders]
+        if not all(self.validity):
+            mask = pc.invert(pa.array(self.validity, pa.bool_()))
+        elif len(arrays) == 0:
+            # This only happens when using empty messages.
+            mask = pa.repeat(False, length)
+        else:
+            mask = None
+        return pa.StructArray.from_arrays(
+            arrays=arrays,
+            fields=list(self.plan.struct_type),
+            mask=mask,
+        )
+
+
+class _BufferBuilder(array.array):
+    """Accumulates primitive values in a typed buffer"""
+
+    def __new__(cls, value_plan: ValuePlan):
+        self = super().__new__(cls, value_plan.typecode)
+        self.value_plan = value_plan
+        return self
+
+    def finish(self) -> pa.Array:
+        return self.value_plan.buffer_to_array(self)
+
+
+def _create_value_builder(
+    value_plan: ValuePlan,
+) -> Union[_ValueBuilder, _MessageBuilder]:
+    if value_plan.message_plan is None:
+        return _ValueBuilder(value_plan)
+    else:
+        return _MessageBuilder(value_plan.message_plan)
+
+
+class _FieldBuilder:
+    """Accumulates the values of a singular field, aligned on the message rows"""
+
+    def __init__(self, field_plan: FieldPlan):
+        self.field_plan = field_plan
+        self.values = _create_value_builder(field_plan.value_plan)
+
+    @staticmethod
+    def create(field_plan: FieldPlan) -> "_FieldBuilder":
+        if field_plan.key_plan is not None:
+            return _MapFieldBuilder(field_plan)
+        elif field_plan.field_descriptor.is_repeated:
+            return _RepeatedFieldBuilder(field_plan)
+        else:
+            return _FieldBuilder(field_plan)
+
+    def append(self, row: int, value: Any) -> None:
+        values = self.values
+        if len(values) != row:
+            values.pad(row - len(values))
+        values.append(value)
+
+    def finish(self, length: int) -> pa.Array:
+        self.values.pad(length - len(self.values))
+        return self.values.finish()
+
+
+class _RepeatedFieldBuilder(_FieldBuilder):
+    def __init__(self, field_plan: FieldPlan):
+        super().__init__(field_plan)
+        self.offsets = [0]
+        if field_plan.value_plan.typecode is not None:
+            self.values = _BufferBuilder(field_plan.value_plan)
+
+    def _pad_offsets(self, length: int) -> None:
+        missing = length + 1 - len(self.offsets)
+        if missing:
+            self.offsets.extend([self.offsets[-1]] * missing)
+
+    def append(self, row: int, value: Any) -> None:
+        self._pad_offsets(row)
+        self.values.extend(value)
+        self.offsets.append(len(self.values))
+
+    def finish(self, length: int) -> pa.Array:
+        self._pad_offsets(length)
+        return self.field_plan.list_from_arrays(self.offsets, self.values.finish())
+
+
+class _MapFieldBuilder(_RepeatedFieldBuilder):
+    def __init__(self, field_plan: FieldPlan):
+        super().__init__(field_plan)
+        self.keys = _create_value_builder(field_plan.key_plan)
+
+    def append(self, row: int, value: Any) -> None:
+        self._pad_offsets(row)
+        keys = list(value)
+        self.keys.extend(keys)
+        self.values.extend(map(value.__getitem__, keys))
+        self.offsets.append(len(self.values))
+
+    def finish(self, length: int) -> pa.Array:
+        self._pad_offsets(length)
+        return self.field_plan.map_from_arrays(
+            self.offsets, self.keys.finish(), self.values.finish()
+        )
+
+
+def _build_value_plan(
+    field_descriptor: FieldDescriptor,
+    config: ProtarrowConfig,
+    descriptor_trace: Tuple[Descriptor, ...] = (),
+    projection: Optional[Projection] = None,
+) -> ValuePlan:
+    converter = _get_converter(field_descriptor, config)
+    if converter is None:
+        message_plan = _build_message_plan(
+            field_descriptor.message_type, config, descriptor_trace, projection
+        )
+        return ValuePlan(
+            field_descriptor=field_descriptor,
+            data_type=message_plan.struct_type,
+            converter=None,
+            null_value=None,
+            message_plan=message_plan,
+        )
+    else:
+        return ValuePlan(
+            field_descriptor=field_descriptor,
+            data_type=field_descriptor_to_data_type(field_descriptor, config),
+            converter=converter,
+            null_value=(
+                None
+                if (
+                    field_descriptor.has_presence
+                    # We use none for repeated field as there should not
+                    # be any missing list elements, they are not nullable
+                    or field_descriptor.is_repeated
+                )
+                else converter(field_descriptor.default_value)
+            ),
+            message_plan=None,
+            array_converter=_get_array_converter(field_descriptor, config),
+            typecode=(
+                _PYARROW_TO_TYPECODE.get(
+                    _PROTO_PRIMITIVE_TYPE_TO_PYARROW[field_descriptor.type]
+                )
+                if field_descriptor.type in _PROTO_PRIMITIVE_TYPE_TO_PYARROW
+                else None
+            ),
+        )
+
+
+def _get_array_converter(
+    field_descriptor: FieldDescriptor,
+    config: ProtarrowConfig,
+) -> Optional[Callable[[Iterable[Any], Optional[Sequence[bool]]], pa.Array]]:
+    if field_descriptor.message_type == Timestamp.DESCRIPTOR:
+        return SecondsNanosArrayConverter(config.timestamp_type, check_timestamp=True)
+    elif field_descriptor.message_type == Duration.DESCRIPTOR:
+        return SecondsNanosArrayConverter(config.duration_type, check_timestamp=False)
+    elif field_descriptor.message_type == Date.DESCRIPTOR:
+        return DateArrayConverter()
+    elif field_descriptor.type == FieldDescriptorProto.TYPE_ENUM and not (
+        pa.types.is_integer(config.enum_type)
+    ):
+        return EnumArrayConverter.create(
+            config.enum_type,
+            field_descriptor.enum_type,
+            (
+                None
+                if field_descriptor.has_presence or field_descriptor.is_repeated
+                else field_descriptor.default_value
+            ),
+        )
+    else:
+        return None
+
+
+def _build_field_plan(
+    field_descriptor: FieldDescriptor,
+    config: ProtarrowConfig,
+    descriptor_trace: Tuple[Descriptor, ...] = (),
+    projection: Optional[Projection] = None,
+) -> FieldPlan:
+    key_plan = None
+    if is_map(field_descriptor):
+        key_field, value_field = get_map_descriptors(field_descriptor)
+        key_plan = _build_value_plan(key_field, config)
+        value_plan = _build_value_plan(value_field, config, descriptor_trace)
+        data_type = _map_data_type(key_plan.data_type, value_plan.data_type, config)
+    elif field_descriptor.is_repeated:
+        value_plan = _build_value_plan(
+            field_descriptor, config, descriptor_trace, projection
+        )
+        data_type = config.list_(value_plan.data_type)
+    else:
+        value_plan = _build_value_plan(
+            field_descriptor, config, descriptor_trace, projection
+        )
+        data_type = value_plan.data_type
+
+    if (
+        field_descriptor.type == FieldDescriptor.TYPE_MESSAGE
+        and not field_descriptor.is_repeated
+    ):
+        getter = NestedMessageGetter(field_descriptor.name)
+    else:
+        getter = operator.attrgetter(field_descriptor.name)
+
+    return FieldPlan(
+        field_descriptor=field_descriptor,
+        field=pa.field(
+            field_descriptor.name,
+            data_type,
+            nullable=_proto_field_nullable(field_descriptor, config),
+            metadata=config.field_metadata(field_descriptor.number),
+        ),
+        getter=getter,
+        value_plan=value_plan,
+        key_plan=key_plan,
+        config=config,
+    )
+
+
+def _build_message_plan(
+    descriptor: Descriptor,
+    config: ProtarrowConfig,
+    descriptor_trace: Tuple[Descriptor, ...] = (),
+    projection: Optional[Projection] = None,
+) -> ProtoToArrowPlan:
+    this_trace = descriptor_trace + (descriptor,)
+    if descriptor not in descriptor_trace:
+        if projection is None:
+            field_plans = tuple(
+                _build_field_plan(field_descriptor, config, this_trace)
+                for field_descriptor in descriptor.fields
             )
         else:
-            mask = _proto_field_validity_mask(messages, field_descriptor)
-            array = _proto_field_to_array(
-                field_values,
-                field_descriptor,
-                validity_mask=mask,
-                config=config,
-                descriptor_trace=this_trace,
+            field_plans = tuple(
+                _build_field_plan(
+                    descriptor.fields_by_name[name], config, this_trace, nested
+                )
+                for name, nested in projection
             )
+    elif config.skip_recursive_messages or len(descriptor.fields) == 0:
+        field_plans = ()
+    else:
+        _raise_recursion_error(this_trace)
+
+    return ProtoToArrowPlan(
+        descriptor=descriptor,
+        config=config,
+        field_plans=field_plans,
+        struct_type=pa.struct([field_plan.field for field_plan in field_plans]),
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def get_proto_to_arrow_plan(
+    descriptor: Descriptor,
+    config: ProtarrowConfig,
+    projection: Optional[Projection] = None,
+) -> ProtoToArrowPlan:
+    """Return the (memoized) conversion plan of a message type for a config"""
+    return _build_message_plan(descriptor, config, (), projection)
+
+
+def _is_nested_message(field_descriptor: FieldDescriptor) -> bool:
+    return (
+        field_descriptor.type == FieldDescriptorProto.TYPE_MESSAGE
+        and not is_map(field_descriptor)
+        and field_descriptor.message_type not in _PROTO_DESCRIPTOR_TO_ARROW_CONVERTER
+        and field_descriptor.message_type
+        not in (Timestamp.DESCRIPTOR, Duration.DESCRIPTOR)
+    )
+
 
-        arrays.append(array)
-        fields.append(
-            pa.field(
-                field_descriptor.name,
-                array.type,
-                nullable=_proto_field_nullable(field_descriptor, config),
-                metadata=config.field_metadata(field_descriptor.number),
+def _build_projection(
+    descriptor: Descriptor, paths: Iterable[Sequence[str]]
+) -> Projection:
+    nested_paths: Dict[str, Optional[List[Sequence[str]]]] = {}
+    for path in paths:
+        name, *rest = path
+        field_descriptor = descriptor.fields_by_name.get(name)
+        if field_descriptor is None:
+            raise ValueError(f"Field {name} not found in {descriptor.full_name}")
+        elif not rest:
+            nested_paths[name] = None
+        elif not _is_nested_message(field_descriptor):
+            raise ValueError(
+                f"Can't select nested field {'.'.join(rest)} "
+                f"of {field_descriptor.full_name}"
             )
+        elif nested_paths.get(name, []) is not None:
+            nested_paths.setdefault(name, []).append(rest)
+
+    return tuple(
+        (
+            field_descriptor.name,
+            None
+            if nested_paths[field_descriptor.name] is None
+            else _build_projection(
+                field_descriptor.message_type, nested_paths[field_descriptor.name]
+            ),
         )
-    if validity_mask is not None:
-        mask = pc.invert(pa.array(validity_mask, pa.bool_()))
-    elif len(arrays) == 0:
-        # This only happens when using empty messages.
-        mask = pa.repeat(False, len(messages))  # type: ignore[arg-type]
-    else:
-        mask = None
-    return pa.StructArray.from_arrays(
-        arrays=arrays,
-        fields=fields,
-        mask=mask,
+        for field_descriptor in descriptor.fields
+        if field_descriptor.name in nested_paths
     )
 
 
+def get_projection(
+    descriptor: Descriptor, columns: Optional[Iterable[str]]
+) -> Optional[Projection]:
+    """
+    Convert a list of field paths (eg `["id", "nested.value"]`) to a `Projection`
+
+    Fields are kept in the order of the message, whatever the order of `columns`.
+    """
+    if columns is None:
+        return None
+    else:
+        if isinstance(columns, str):
+            raise TypeError("columns must be a list of field paths, not a string")
+        return _build_projection(descriptor, (column.split(".") for column in columns))
+
+
 def messages_to_record_batch(
     messages: Iterable[M],
     message_type: Type[M],
     config: ProtarrowConfig = ProtarrowConfig(),
+    columns: Optional[Iterable[str]] = None,
 ):
-    return pa.RecordBatch.from_struct_array(
-        _messages_to_array(
-            messages,
-            message_type.DESCRIPTOR,
-            validity_mask=None,
-            config=config,
-        )
+    """
+    Converts messages to a `pa.RecordBatch`
+
+    If provided, only the fields in `columns` are converted.
+    Nested fields can be selected with their path, eg `"nested.value"`.
+    """
+    if not isinstance(messages, collections.abc.Sequence):
+        # The conversion goes through the messages once per field
+        messages = list(messages)
+    return get_proto_to_arrow_plan(
+        message_type.DESCRIPTOR,
+        config,
+        get_projection(message_type.DESCRIPTOR, columns),
+    ).to_record_batch(messages)
+
+
+def _chunk_messages(
+    messages: Iterable[M], batch_size: int, max_bytes: Optional[int]
+) -> Iterator[List[M]]:
+    if batch_size <= 0:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+    chunk = []
+    chunk_bytes = 0
+    for message in messages:
+        chunk.append(message)
+        if max_bytes is not None:
+            chunk_bytes += message.ByteSize()
+        if len(chunk) >= batch_size or (
+            max_bytes is not None and chunk_bytes >= max_bytes
+        ):
+            yield chunk
+            chunk = []
+            chunk_bytes = 0
+    if chunk:
+        yield chunk
+
+
+def messages_to_record_batches(
+    messages: Iterable[M],
+    message_type: Type[M],
+    config: ProtarrowConfig = ProtarrowConfig(),
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_bytes: Optional[int] = None,
+    columns: Optional[Iterable[str]] = None,
+) -> Iterator[pa.RecordBatch]:
+    """
+    Converts an iterable of protobuf messages to `pa.RecordBatch`, in chunks
+
+    The iterable is consumed only once, and only one chunk of messages is held in
+    memory at a time. A chunk is converted once it reaches `batch_size` messages,
+    or `max_bytes` of serialized message size, if provided.
+    """
+    plan = get_proto_to_arrow_plan(
+        message_type.DESCRIPTOR,
+        config,
+        get_projection(message_type.DESCRIPTOR, columns),
+    )
+    for chunk in _chunk_messages(messages, batch_size, max_bytes):
+        yield plan.to_record_batch(chunk)
+
+
+def messages_to_record_batch_reader(
+    messages: Iterable[M],
+    message_type: Type[M],
+    config: ProtarrowConfig = ProtarrowConfig(),
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_bytes: Optional[int] = None,
+    columns: Optional[Iterable[str]] = None,
+) -> pa.RecordBatchReader:
+    """Lazily converts an iterable of protobuf messages to a `pa.RecordBatchReader`"""
+    projection = get_projection(message_type.DESCRIPTOR, columns)
+    plan = get_proto_to_arrow_plan(message_type.DESCRIPTOR, config, projection)
+    return pa.RecordBatchReader.from_batches(
+        pa.schema(list(plan.struct_type)),
+        (
+            plan.to_record_batch(chunk)
+            for chunk in _chunk_messages(messages, batch_size, max_bytes)
+        ),
+    )
+
+
+def serialized_to_record_batch(
+    payloads: Union[Iterable[bytes], pa.BinaryArray, pa.LargeBinaryArray],
+    message_type: Type[M],
+    config: ProtarrowConfig = ProtarrowConfig(),
+    columns: Optional[Iterable[str]] = None,
+) -> pa.RecordBatch:
+    """
+    Converts serialized protobuf payloads to a `pa.RecordBatch`
+
+    The payloads are decoded by the protobuf runtime parser, which is faster than
+    decoding the wire format in python, and converted using the cached plan.
+    """
+    if isinstance(payloads, (pa.Array, pa.ChunkedArray)):
+        payloads = payloads.to_pylist()
+    from_string = message_type.FromString
+    return messages_to_record_batch(
+        [from_string(payload) for payload in payloads], message_type, config, columns
+    )
+
+
+def _serialized_to_ipc(
+    file_descriptor_set: bytes,
+    full_name: str,
+    payloads: List[bytes],
+    config: ProtarrowConfig,
+    columns: Optional[Tuple[str, ...]],
+) -> pa.Buffer:
+    message_type = get_message_class(file_descriptor_set, full_name)
+    return record_batch_to_ipc(
+        serialized_to_record_batch(payloads, message_type, config, columns)
     )
 
 
@@ -706,17 +1416,57 @@ def messages_to_table(
     messages: Iterable[M],
     message_type: Type[M],
     config: ProtarrowConfig = ProtarrowConfig(),
+    columns: Optional[Iterable[str]] = None,
+    workers: Optional[int] = None,
 ) -> pa.Table:
-    """Converts a list of protobuf messages to a `pa.Table`"""
+    """
+    Converts a list of protobuf messages to a `pa.Table`
+
+    When `workers` is set, the messages are split in `workers` shards, which
+    are serialized and converted in a pool of processes. The table has one
+    record batch per shard, in the order of the messages.
+    """
     assert isinstance(config, ProtarrowConfig), config
-    record_batch = messages_to_record_batch(messages, message_type, config=config)
-    return pa.Table.from_batches([record_batch])
+    if workers is None:
+        record_batch = messages_to_record_batch(
+            messages, message_type, config=config, columns=columns
+        )
+        return pa.Table.from_batches([record_batch])
+
+    check_workers(workers)
+    if columns is not None and not isinstance(columns, str):
+        columns = tuple(columns)
+    # Validates the columns before starting the workers
+    get_projection(message_type.DESCRIPTOR, columns)
+    file_descriptor_set = get_file_descriptor_set(message_type.DESCRIPTOR)
+    tasks = [
+        (
+            file_descriptor_set,
+            message_type.DESCRIPTOR.full_name,
+            [message.SerializeToString() for message in shard],
+            config,
+            columns,
+        )
+        for shard in split(list(messages), workers)
+    ]
+    return pa.Table.from_batches(
+        [
+            ipc_to_record_batch(buffer)
+            for buffer in map_in_processes(_serialized_to_ipc, tasks, workers)
+        ],
+        message_type_to_schema(message_type, config, columns),
+    )
 
 
 def message_type_to_schema(
     message_type: Type[Message],
     config: ProtarrowConfig = ProtarrowConfig(),
+    columns: Optional[Iterable[str]] = None,
 ) -> pa.Schema:
+    if columns is not None:
+        return pa.schema(
+            list(message_type_to_struct_type(message_type, config, columns))
+        )
     descriptor_trace = (message_type.DESCRIPTOR,)
 
     return pa.schema(
@@ -730,7 +1480,14 @@ def message_type_to_schema(
 def message_type_to_struct_type(
     message_type: Type[Message],
     config: ProtarrowConfig = ProtarrowConfig(),
+    columns: Optional[Iterable[str]] = None,
 ) -> pa.StructType:
+    if columns is not None:
+        return get_proto_to_arrow_plan(
+            message_type.DESCRIPTOR,
+            config,
+            get_projection(message_type.DESCRIPTOR, columns),
+        ).struct_type
     descriptor_trace = (message_type.DESCRIPTOR,)
 
     return pa.struct(
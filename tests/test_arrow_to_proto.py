@@ -1,36 +1,254 @@
 import pyarrow as pa
+import pytest
+from google.protobuf.duration_pb2 import Duration
+from google.protobuf.timestamp_pb2 import Timestamp
+from google.protobuf.wrappers_pb2 import DoubleValue, Int32Value, StringValue
+from google.type.timeofday_pb2 import TimeOfDay
 
-from protarrow.arrow_to_proto import ListValuesIterator, OffsetsIterator
+from protarrow.arrow_to_proto import (
+    LazyMessageSequence,
+    _enum_array_to_numbers,
+    _temporal_to_components,
+    iter_table_messages,
+    record_batch_to_lazy_messages,
+    record_batch_to_messages,
+    table_to_messages,
+)
+from protarrow.proto_to_arrow import messages_to_record_batch
+from protarrow_protos.bench_pb2 import (
+    ExampleEnum,
+    ExampleMessage,
+    NestedExampleMessage,
+    SuperNestedExampleMessage,
+)
+from tests.random_generator import generate_messages
 
 
-def test_offsets_iterator():
-    array = pa.array([[1], [], None, [1, 2], [1, 2, 3]])
-
-    assert list(OffsetsIterator(array.offsets)) == [
-        (0, 1),
-        (1, 1),
-        (1, 1),
-        (1, 3),
-        (3, 6),
+def test_repeated_values_aligned_under_null_parent():
+    struct_array = pa.StructArray.from_arrays(
+        [pa.array([[1, 2], [3]], pa.list_(pa.int32()))],
+        names=["int32_values"],
+        mask=pa.array([True, False]),
+    )
+    record_batch = pa.RecordBatch.from_arrays([struct_array], names=["example_message"])
+    assert record_batch_to_messages(record_batch, NestedExampleMessage) == [
+        NestedExampleMessage(),
+        NestedExampleMessage(example_message=ExampleMessage(int32_values=[3])),
     ]
 
-    assert list(OffsetsIterator(array[1:].offsets)) == [
-        (1, 1),
-        (1, 1),
-        (1, 3),
-        (3, 6),
-    ]
 
-    assert list(OffsetsIterator(array[:-2].offsets)) == [
-        (0, 1),
-        (1, 1),
-        (1, 1),
-    ]
+@pytest.mark.parametrize(
+    "column,array,expected",
+    [
+        (
+            "wrapped_double_values",
+            pa.array([[1.0, None]]),
+            [DoubleValue(value=1.0), DoubleValue()],
+        ),
+        (
+            "wrapped_string_values",
+            pa.array([["foo", None]]),
+            [StringValue(value="foo"), StringValue()],
+        ),
+        (
+            "wrapped_int32_values",
+            pa.array([[1, None]], pa.list_(pa.int32())),
+            [Int32Value(value=1), Int32Value()],
+        ),
+        (
+            "example_enum_values",
+            pa.array([["EXAMPLE_ENUM_1", None]]),
+            [ExampleEnum.EXAMPLE_ENUM_1, ExampleEnum.UNKNOWN_EXAMPLE_ENUM],
+        ),
+        (
+            "example_enum_values",
+            pa.array(
+                [["EXAMPLE_ENUM_1", None]],
+                pa.list_(pa.dictionary(pa.int32(), pa.string())),
+            ),
+            [ExampleEnum.EXAMPLE_ENUM_1, ExampleEnum.UNKNOWN_EXAMPLE_ENUM],
+        ),
+    ],
+)
+def test_repeated_null_values_are_default(column, array, expected):
+    (message,) = table_to_messages(pa.table({column: array}), ExampleMessage)
+    assert list(getattr(message, column)) == expected
 
 
-def test_list_value_iterator():
-    array = pa.array([[1], [], None, [None], [1, 2], [1, 2, 3]])
-    assert isinstance(array, pa.ListArray)
-    assert list(ListValuesIterator(array)) == [
-        pa.scalar(i, pa.int64()) for i in [1, None, 1, 2, 1, 2, 3]
+def test_repeated_messages_aligned_under_null_parent():
+    repeated_type = pa.list_(pa.struct([pa.field("int32_value", pa.int32())]))
+    struct_array = pa.StructArray.from_arrays(
+        [
+            pa.array(
+                [[{"int32_value": 1}, {"int32_value": 2}], [{"int32_value": 3}]],
+                repeated_type,
+            )
+        ],
+        names=["repeated_example_message"],
+        mask=pa.array([True, False]),
+    )
+    record_batch = pa.RecordBatch.from_arrays(
+        [struct_array], names=["nested_example_message"]
+    )
+    assert record_batch_to_messages(record_batch, SuperNestedExampleMessage) == [
+        SuperNestedExampleMessage(),
+        SuperNestedExampleMessage(
+            nested_example_message=NestedExampleMessage(
+                repeated_example_message=[ExampleMessage(int32_value=3)]
+            )
+        ),
     ]
+
+
+@pytest.mark.parametrize("value_type", [pa.string(), pa.struct([])])
+def test_map_entries_aligned_under_null_parent(value_type: pa.DataType):
+    map_type = pa.map_(pa.int32(), value_type)
+    value = "" if value_type == pa.string() else {}
+    struct_array = pa.StructArray.from_arrays(
+        [pa.array([[(1, value), (2, value)], [(3, value)]], map_type)],
+        names=["string_int32_map" if value_type == pa.string() else "empty_int32_map"],
+        mask=pa.array([True, False]),
+    )
+    record_batch = pa.RecordBatch.from_arrays([struct_array], names=["example_message"])
+    messages = record_batch_to_messages(record_batch, NestedExampleMessage)
+    assert not messages[0].HasField("example_message")
+    assert [
+        list(getattr(messages[1].example_message, name))
+        for name in ["string_int32_map", "empty_int32_map"]
+    ] == ([[3], []] if value_type == pa.string() else [[], [3]])
+
+
+def test_lazy_messages():
+    messages = [ExampleMessage(int32_value=i, string_value=str(i)) for i in range(10)]
+    record_batch = messages_to_record_batch(messages, ExampleMessage)
+
+    lazy_messages = record_batch_to_lazy_messages(
+        record_batch, ExampleMessage, block_size=3, max_cached_blocks=2
+    )
+    assert isinstance(lazy_messages, LazyMessageSequence)
+    assert len(lazy_messages) == 10
+    assert lazy_messages._blocks == {}
+
+    assert lazy_messages[4] == messages[4]
+    assert list(lazy_messages._blocks) == [1]
+    assert lazy_messages[-1] == messages[-1]
+    assert lazy_messages[4] is lazy_messages[4]
+    assert list(lazy_messages._blocks) == [3, 1]
+    assert lazy_messages[0] == messages[0]
+    assert list(lazy_messages._blocks) == [1, 0]
+
+    assert lazy_messages[2:8:2] == messages[2:8:2]
+    assert list(lazy_messages) == messages
+    assert len(lazy_messages._blocks) == 2
+    assert lazy_messages.index(messages[5]) == 5
+
+    with pytest.raises(IndexError, match="out of range"):
+        lazy_messages[10]
+    with pytest.raises(IndexError, match="out of range"):
+        lazy_messages[-11]
+
+
+def test_lazy_messages_empty():
+    record_batch = messages_to_record_batch([], ExampleMessage)
+    assert list(record_batch_to_lazy_messages(record_batch, ExampleMessage)) == []
+
+
+@pytest.mark.parametrize("block_size,max_cached_blocks", [(0, 1), (1, 0)])
+def test_lazy_messages_wrong_arguments(block_size, max_cached_blocks):
+    record_batch = messages_to_record_batch([], ExampleMessage)
+    with pytest.raises(ValueError, match="must be positive"):
+        LazyMessageSequence(record_batch, ExampleMessage, block_size, max_cached_blocks)
+
+
+class _CStreamSource:
+    def __init__(self, table: pa.Table):
+        self._table = table
+
+    def __arrow_c_stream__(self, requested_schema=None):
+        return self._table.__arrow_c_stream__(requested_schema)
+
+
+def test_iter_table_messages():
+    messages = [ExampleMessage(int32_values=[i] * i) for i in range(10)]
+    record_batch = messages_to_record_batch(messages, ExampleMessage)
+    table = pa.Table.from_batches([record_batch[:7], record_batch[7:]])
+
+    assert list(iter_table_messages(table, ExampleMessage)) == messages
+    assert list(iter_table_messages(table, ExampleMessage, batch_size=3)) == messages
+    assert (
+        list(iter_table_messages(table.to_reader(), ExampleMessage, batch_size=3))
+        == messages
+    )
+    assert list(iter_table_messages(_CStreamSource(table), ExampleMessage)) == messages
+
+    iterator = iter_table_messages(table.to_reader(), ExampleMessage, batch_size=2)
+    assert next(iterator) == messages[0]
+
+
+def test_iter_table_messages_wrong_arguments():
+    table = pa.table({"int32_value": pa.array([1], pa.int32())})
+    with pytest.raises(ValueError, match="batch_size must be positive"):
+        next(iter_table_messages(table, ExampleMessage, batch_size=0))
+    with pytest.raises(TypeError, match="Expected a pa.Table"):
+        next(iter_table_messages([1, 2], ExampleMessage))
+
+
+@pytest.mark.parametrize("batch_size", [None, 2, 100])
+def test_table_to_messages_workers(batch_size):
+    messages = generate_messages(NestedExampleMessage, 5)
+    record_batch = messages_to_record_batch(messages, NestedExampleMessage)
+    table = pa.Table.from_batches([record_batch[:1], record_batch[1:]])
+
+    assert (
+        table_to_messages(table, NestedExampleMessage, workers=2, batch_size=batch_size)
+        == messages
+    )
+
+
+def test_table_to_messages_workers_empty():
+    table = messages_to_record_batch([], ExampleMessage)
+    assert table_to_messages(pa.Table.from_batches([table]), ExampleMessage, 2) == []
+
+
+@pytest.mark.parametrize("workers,batch_size", [(0, None), (1, 0)])
+def test_table_to_messages_workers_wrong_arguments(workers, batch_size):
+    table = pa.table({"int32_value": pa.array([1], pa.int32())})
+    with pytest.raises(ValueError, match="must be positive"):
+        table_to_messages(table, ExampleMessage, workers, batch_size)
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        pa.array(["EXAMPLE_ENUM_2", None, "FOO", "EXAMPLE_ENUM_1"], pa.string()),
+        pa.array(["EXAMPLE_ENUM_2", None, "FOO", "EXAMPLE_ENUM_1"], pa.large_string()),
+        pa.array([b"EXAMPLE_ENUM_2", None, b"FOO", b"EXAMPLE_ENUM_1"], pa.binary()),
+        pa.array(["EXAMPLE_ENUM_2", None, "FOO", "EXAMPLE_ENUM_1"]).dictionary_encode(),
+        pa.array([2, None, 0, 1], pa.int32()),
+    ],
+)
+def test_enum_array_to_numbers(array: pa.Array):
+    numbers = _enum_array_to_numbers(array, ExampleEnum.DESCRIPTOR)
+    assert numbers.type == pa.int32()
+    assert numbers.to_pylist() == [2, None, 0, 1]
+
+
+@pytest.mark.parametrize("message_type", [Timestamp, Duration])
+def test_temporal_to_components_seconds_nanos(message_type):
+    array = pa.array([-1_500, None, 0, 2_000_001], pa.duration("us"))
+    if message_type is Timestamp:
+        array = array.cast(pa.int64()).cast(pa.timestamp("us", "UTC"))
+    assert _temporal_to_components(array, message_type.DESCRIPTOR) == {
+        "seconds": [-1, None, 0, 2],
+        "nanos": [998_500_000, None, 0, 1_000],
+    }
+
+
+def test_temporal_to_components_time_of_day():
+    array = pa.array([None, 0, 3_723_004], pa.time32("ms"))
+    assert _temporal_to_components(array, TimeOfDay.DESCRIPTOR) == {
+        "hours": [None, 0, 1],
+        "minutes": [None, 0, 2],
+        "seconds": [None, 0, 3],
+        "nanos": [None, 0, 4_000_000],
+    }
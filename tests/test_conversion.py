@@ -1,3 +1,4 @@
+import dataclasses
 import pathlib
 from typing import Any, Iterable, List, Type
 
@@ -16,6 +17,8 @@ import protarrow
 from protarrow.arrow_to_proto import (
     create_enum_converter,
     is_custom_field,
+    record_batch_to_messages,
+    record_batch_to_serialized,
     table_to_messages,
 )
 from protarrow.cast_to_proto import (
@@ -26,16 +29,21 @@ from protarrow.cast_to_proto import (
     maybe_copy_offsets,
 )
 from protarrow.common import M, ProtarrowConfig, offset_values_array
-from protarrow.message_extractor import MessageExtractor
+from protarrow.message_extractor import CacheInfo, MessageExtractor
 from protarrow.proto_to_arrow import (
+    EnumArrayConverter,
     NestedIterable,
-    _messages_to_array,
-    _repeated_proto_to_array,
+    SecondsNanosArrayConverter,
+    _build_field_plan,
     field_descriptor_to_field,
+    get_proto_to_arrow_plan,
     message_type_to_schema,
     message_type_to_struct_type,
     messages_to_record_batch,
+    messages_to_record_batch_reader,
+    messages_to_record_batches,
     messages_to_table,
+    serialized_to_record_batch,
 )
 from protarrow_protos.bench_pb2 import (
     ExampleMessage,
@@ -92,6 +100,7 @@ CONFIGS = [
     ProtarrowConfig(string_type=pa.large_string()),
     ProtarrowConfig(binary_type=pa.large_binary()),
     ProtarrowConfig(map_as_list=True),
+    ProtarrowConfig(single_pass=True),
     ProtarrowConfig(list_array_type=pa.LargeListArray),
 ]
 
@@ -124,6 +133,17 @@ def test_message_type_to_struct_type(
     assert isinstance(struct_type, pa.StructType)
 
 
+@pytest.mark.parametrize("message_type", MESSAGES)
+@pytest.mark.parametrize("config", CONFIGS)
+def test_proto_to_arrow_plan(message_type: Type[Message], config: ProtarrowConfig):
+    plan = get_proto_to_arrow_plan(message_type.DESCRIPTOR, config)
+    assert plan is get_proto_to_arrow_plan(message_type.DESCRIPTOR, config)
+    assert plan.struct_type == message_type_to_struct_type(message_type, config)
+    assert pa.schema(list(plan.struct_type)) == message_type_to_schema(
+        message_type, config
+    )
+
+
 @pytest.mark.parametrize("message_type", MESSAGES)
 @pytest.mark.parametrize("config", CONFIGS)
 def test_with_random(message_type: Type[Message], config: ProtarrowConfig):
@@ -134,6 +154,211 @@ def test_with_random(message_type: Type[Message], config: ProtarrowConfig):
     _check_messages_same(truncated_messages, messages_back)
 
 
+@pytest.mark.parametrize("message_type", MESSAGES)
+@pytest.mark.parametrize("config", CONFIGS[:5])
+def test_serialized_to_record_batch(
+    message_type: Type[Message], config: ProtarrowConfig
+):
+    source_messages = generate_messages(message_type, TEST_MESSAGE_COUNT)
+    payloads = [message.SerializeToString() for message in source_messages]
+    truncated_messages = truncate_messages(source_messages, config)
+
+    record_batch = serialized_to_record_batch(payloads, message_type, config)
+    assert record_batch.schema == message_type_to_schema(message_type, config)
+    _check_messages_same(
+        truncated_messages, record_batch_to_messages(record_batch, message_type)
+    )
+
+    record_batch = serialized_to_record_batch(
+        pa.array(payloads, pa.binary()), message_type, config
+    )
+    _check_messages_same(
+        truncated_messages, record_batch_to_messages(record_batch, message_type)
+    )
+
+
+@pytest.mark.parametrize("message_type", MESSAGES)
+@pytest.mark.parametrize("config", CONFIGS[:5])
+def test_record_batch_to_serialized(
+    message_type: Type[Message], config: ProtarrowConfig
+):
+    source_messages = generate_messages(message_type, TEST_MESSAGE_COUNT)
+    record_batch = messages_to_record_batch(source_messages, message_type, config)
+    messages = record_batch_to_messages(record_batch, message_type)
+
+    payloads = record_batch_to_serialized(record_batch, message_type, batch_size=2)
+    assert payloads.type == pa.binary()
+    assert payloads.to_pylist() == [message.SerializeToString() for message in messages]
+    assert [message_type.FromString(p) for p in payloads.to_pylist()] == messages
+    assert record_batch_to_serialized(record_batch[:0], message_type) == pa.array(
+        [], pa.binary()
+    )
+
+
+def test_record_batch_to_serialized_wrong_batch_size():
+    record_batch = messages_to_record_batch([ExampleMessage()], ExampleMessage)
+    with pytest.raises(ValueError, match="batch_size must be positive"):
+        record_batch_to_serialized(record_batch, ExampleMessage, batch_size=0)
+
+
+@pytest.mark.parametrize("message_type", MESSAGES)
+@pytest.mark.parametrize("config", CONFIGS)
+def test_single_pass_same_as_column_major(
+    message_type: Type[Message], config: ProtarrowConfig
+):
+    source_messages = generate_messages(message_type, TEST_MESSAGE_COUNT, 3) + [
+        message_type()
+    ]
+    single_pass_config = dataclasses.replace(config, single_pass=True)
+    column_major_config = dataclasses.replace(config, single_pass=False)
+    assert messages_to_record_batch(
+        source_messages, message_type, single_pass_config
+    ) == messages_to_record_batch(source_messages, message_type, column_major_config)
+
+
+@pytest.mark.parametrize(
+    "config", [ProtarrowConfig(), ProtarrowConfig(single_pass=True)]
+)
+def test_messages_to_record_batch_columns(config: ProtarrowConfig):
+    messages = generate_messages(NestedExampleMessage, TEST_MESSAGE_COUNT)
+    columns = [
+        "repeated_example_message.int32_value",
+        "example_message.timestamp_value",
+        "example_message.int32_value",
+        "example_message_int32_map",
+        "example_message",
+    ]
+    record_batch = messages_to_record_batch(
+        messages, NestedExampleMessage, config, columns=columns
+    )
+    full_record_batch = messages_to_record_batch(messages, NestedExampleMessage, config)
+
+    assert record_batch.schema.names == [
+        "example_message",
+        "repeated_example_message",
+        "example_message_int32_map",
+    ]
+    assert record_batch["example_message"] == full_record_batch["example_message"]
+    assert (
+        record_batch["example_message_int32_map"]
+        == full_record_batch["example_message_int32_map"]
+    )
+    assert record_batch["repeated_example_message"].type.value_type == pa.struct(
+        [
+            full_record_batch["repeated_example_message"].type.value_type.field(
+                "int32_value"
+            )
+        ]
+    )
+    assert record_batch.schema == message_type_to_schema(
+        NestedExampleMessage, config, columns=columns
+    )
+    assert pa.struct(list(record_batch.schema)) == message_type_to_struct_type(
+        NestedExampleMessage, config, columns=columns
+    )
+    assert messages_to_table(
+        messages, NestedExampleMessage, config, columns=columns
+    ) == pa.Table.from_batches([record_batch])
+
+
+@pytest.mark.parametrize(
+    ["columns", "error"],
+    [
+        (["foo"], "Field foo not found in protarrow.protos.NestedExampleMessage"),
+        (["example_message.foo"], "Field foo not found"),
+        (["example_message.timestamp_value.seconds"], "Can't select nested field"),
+        (["example_message_int32_map.key"], "Can't select nested field"),
+    ],
+)
+def test_messages_to_record_batch_columns_invalid(columns: List[str], error: str):
+    with pytest.raises(ValueError, match=error):
+        messages_to_record_batch([], NestedExampleMessage, columns=columns)
+
+
+def test_messages_to_record_batch_columns_string():
+    with pytest.raises(TypeError, match="columns must be a list"):
+        messages_to_record_batch([], NestedExampleMessage, columns="example_message")
+
+
+@pytest.mark.parametrize("message_type", [ExampleMessage, NestedExampleMessage])
+def test_messages_to_table_workers(message_type: Type[Message]):
+    source_messages = generate_messages(message_type, 5)
+    config = ProtarrowConfig(enum_type=pa.dictionary(pa.int32(), pa.string()))
+    table = messages_to_table(source_messages, message_type, config, workers=2)
+
+    assert table.schema == message_type_to_schema(message_type, config)
+    assert [len(batch) for batch in table.to_batches()] == [3, 2]
+    assert table_to_messages(table, message_type) == source_messages
+
+
+def test_messages_to_table_workers_columns():
+    source_messages = generate_messages(NestedExampleMessage, 5)
+    columns = ["example_message.int32_value", "repeated_example_message"]
+    table = messages_to_table(
+        source_messages, NestedExampleMessage, workers=2, columns=iter(columns)
+    )
+    expected = messages_to_table(source_messages, NestedExampleMessage, columns=columns)
+    assert table.schema == expected.schema
+    # Map entries may come back in a different order from the workers
+    assert table_to_messages(table, NestedExampleMessage) == table_to_messages(
+        expected, NestedExampleMessage
+    )
+
+
+def test_messages_to_table_workers_empty():
+    table = messages_to_table([], ExampleMessage, workers=2)
+    assert table.num_rows == 0
+    assert table.schema == message_type_to_schema(ExampleMessage)
+
+
+def test_messages_to_table_workers_invalid():
+    with pytest.raises(ValueError, match="workers must be positive"):
+        messages_to_table([ExampleMessage()], ExampleMessage, workers=0)
+
+
+def test_messages_to_record_batch_generator():
+    source_messages = generate_messages(ExampleMessage, TEST_MESSAGE_COUNT)
+    assert messages_to_record_batch(
+        (message for message in source_messages), ExampleMessage
+    ) == messages_to_record_batch(source_messages, ExampleMessage)
+
+
+def test_messages_to_record_batches():
+    source_messages = generate_messages(NestedExampleMessage, TEST_MESSAGE_COUNT)
+    record_batches = list(
+        messages_to_record_batches(
+            (message for message in source_messages), NestedExampleMessage, batch_size=2
+        )
+    )
+    assert [len(record_batch) for record_batch in record_batches] == [2, 2, 1]
+    assert pa.Table.from_batches(record_batches) == messages_to_table(
+        source_messages, NestedExampleMessage
+    )
+
+    record_batches = list(
+        messages_to_record_batches(source_messages, NestedExampleMessage, max_bytes=1)
+    )
+    assert [len(record_batch) for record_batch in record_batches] == [1] * len(
+        source_messages
+    )
+    assert list(messages_to_record_batches([], NestedExampleMessage)) == []
+
+    with pytest.raises(ValueError, match="batch_size must be positive"):
+        list(messages_to_record_batches([], NestedExampleMessage, batch_size=0))
+
+
+def test_messages_to_record_batch_reader():
+    source_messages = generate_messages(ExampleMessage, TEST_MESSAGE_COUNT)
+    reader = messages_to_record_batch_reader(
+        iter(source_messages), ExampleMessage, batch_size=3
+    )
+    assert reader.schema == message_type_to_schema(ExampleMessage)
+    assert reader.read_all() == messages_to_table(source_messages, ExampleMessage)
+
+    empty_reader = messages_to_record_batch_reader([], ExampleMessage)
+    assert empty_reader.read_all() == messages_to_table([], ExampleMessage)
+
+
 @pytest.mark.parametrize("message_type", MESSAGES)
 @pytest.mark.parametrize("config", CONFIGS)
 @pytest.mark.parametrize("index", [0, 1, 3])
@@ -210,17 +435,16 @@ def test_enum_values_as_int():
         ExampleMessage(),
     ]
 
-    array = _repeated_proto_to_array(
-        NestedIterable(records, lambda x: x.example_enum_values),
+    array = _build_field_plan(
         ExampleMessage.DESCRIPTOR.fields_by_name["example_enum_values"],
         ProtarrowConfig(),
-    )
+    ).repeated_to_array(NestedIterable(records, lambda x: x.example_enum_values))
     assert array.to_pylist() == [[0, 1, 0], [], []]
 
 
 def test_messages_to_array_empty():
-    assert _messages_to_array(
-        [Empty(), Empty()], Empty.DESCRIPTOR, None, ProtarrowConfig()
+    assert get_proto_to_arrow_plan(Empty.DESCRIPTOR, ProtarrowConfig()).to_array(
+        [Empty(), Empty()], None
     ) == pa.StructArray.from_arrays([], names=[], mask=pa.array([False, False]))
 
 
@@ -231,11 +455,10 @@ def test_empty_values():
         ExampleMessage(),
     ]
 
-    array = _repeated_proto_to_array(
-        NestedIterable(records, lambda x: x.empty_values),
+    array = _build_field_plan(
         ExampleMessage.DESCRIPTOR.fields_by_name["empty_values"],
         ProtarrowConfig(),
-    )
+    ).repeated_to_array(NestedIterable(records, lambda x: x.empty_values))
     assert array.to_pylist() == [[{}, {}, {}], [], []]
 
 
@@ -289,11 +512,10 @@ def test_repeated_enum_values_as_string(config: ProtarrowConfig, expected: list)
         ExampleMessage(),
     ]
 
-    array = _repeated_proto_to_array(
-        NestedIterable(records, lambda x: x.example_enum_values),
+    array = _build_field_plan(
         ExampleMessage.DESCRIPTOR.fields_by_name["example_enum_values"],
         config,
-    )
+    ).repeated_to_array(NestedIterable(records, lambda x: x.example_enum_values))
     assert array.to_pylist() == expected
 
 
@@ -482,6 +704,49 @@ def test_nested_enums():
     ).to_pylist() == [b"UNKNOWN_EXAMPLE_ENUM"]
 
 
+@pytest.mark.parametrize(
+    "enum_type",
+    [
+        pa.string(),
+        pa.binary(),
+        pa.dictionary(pa.int32(), pa.string()),
+        pa.dictionary(pa.int32(), pa.binary()),
+    ],
+)
+@pytest.mark.parametrize("single_pass", [False, True])
+def test_enum_array_converter(enum_type: pa.DataType, single_pass: bool):
+    messages = [
+        ExampleMessage(example_enum_value=2, example_enum_values=[1, 2, 5]),
+        ExampleMessage(example_enum_value=7),
+    ]
+    record_batch = messages_to_record_batch(
+        messages,
+        ExampleMessage,
+        ProtarrowConfig(enum_type=enum_type, single_pass=single_pass),
+    )
+    assert record_batch["example_enum_value"].type == enum_type
+    expected = ["EXAMPLE_ENUM_2", "UNKNOWN_EXAMPLE_ENUM"]
+    assert record_batch["example_enum_value"].cast(pa.string()).to_pylist() == expected
+    assert record_batch["example_enum_values"].cast(
+        pa.list_(pa.string())
+    ).to_pylist() == [["EXAMPLE_ENUM_1", "EXAMPLE_ENUM_2", "UNKNOWN_EXAMPLE_ENUM"], []]
+    if pa.types.is_dictionary(enum_type):
+        assert record_batch["example_enum_value"].dictionary.cast(
+            pa.string()
+        ).to_pylist() == ["UNKNOWN_EXAMPLE_ENUM", "EXAMPLE_ENUM_1", "EXAMPLE_ENUM_2"]
+
+
+def test_enum_array_converter_nulls():
+    field_descriptor = ExampleMessage.DESCRIPTOR.fields_by_name["example_enum_value"]
+    converter = EnumArrayConverter.create(pa.string(), field_descriptor.enum_type, None)
+    assert converter([1, None, 2, 3], [True, True, False, True]).to_pylist() == [
+        "EXAMPLE_ENUM_1",
+        None,
+        None,
+        "UNKNOWN_EXAMPLE_ENUM",
+    ]
+
+
 def test_create_enum_converter_wrong_type():
     with pytest.raises(TypeError, match=r"double"):
         create_enum_converter(
@@ -520,6 +785,21 @@ def test_cast_same_view(message_type: Type[Message], config: ProtarrowConfig):
     assert casted_view == view
 
 
+@pytest.mark.parametrize("message_type", MESSAGES)
+@pytest.mark.parametrize("config", CONFIGS[:5])
+def test_cast_threads(message_type: Type[Message], config: ProtarrowConfig):
+    source_messages = generate_messages(message_type, TEST_MESSAGE_COUNT)
+    table = messages_to_table(source_messages, message_type, config)
+    table = pa.Table.from_batches(
+        [table.to_batches()[0][i : i + 1] for i in range(len(table))]
+    )
+    casted_table = cast_table(
+        table, message_type, config, use_threads=True, max_workers=2
+    )
+    assert casted_table == table
+    assert casted_table.to_batches() == table.to_batches()
+
+
 def test_is_custom_field():
     assert not is_custom_field(
         ExampleMessage.DESCRIPTOR.fields_by_name["wrapped_double_value"]
@@ -576,6 +856,177 @@ def test_extractor_null_values(message_type: Type[Message], config: ProtarrowCon
     assert messages == [message_type()] * len(table)
 
 
+def test_extractor_chunked():
+    source_messages = generate_messages(ExampleMessage, 7)
+    record_batch = messages_to_record_batch(source_messages, ExampleMessage)
+    # Columns with different chunk layouts, including empty chunks
+    table = pa.Table.from_batches(
+        [record_batch[:2], record_batch[2:2], record_batch[2:]]
+    ).set_column(
+        0,
+        record_batch.schema.field(0),
+        pa.chunked_array(
+            [record_batch.column(0)[:5], record_batch.column(0)[5:]],
+        ),
+    )
+
+    message_extractor = MessageExtractor(table.schema, ExampleMessage)
+    assert [
+        message_extractor.read_table_row(table, row) for row in range(len(table))
+    ] == source_messages
+    assert message_extractor.read_table_row(table, -1) == source_messages[-1]
+    with pytest.raises(IndexError):
+        message_extractor.read_table_row(table, 7)
+    with pytest.raises(IndexError):
+        message_extractor.read_table_row(table, -8)
+
+    other_table = pa.Table.from_batches([record_batch[3:]])
+    for row in range(4):
+        assert (
+            message_extractor.read_table_row(other_table, row)
+            == (source_messages[row + 3])
+        )
+        assert message_extractor.read_table_row(table, row) == source_messages[row]
+
+
+@pytest.mark.parametrize("message_type", MESSAGES)
+def test_extractor_read_table_rows(message_type: Type[Message]):
+    source_messages = generate_messages(message_type, TEST_MESSAGE_COUNT)
+    table = messages_to_table(source_messages, message_type)
+    table = pa.concat_tables([table[:3], table[3:]])
+    message_extractor = MessageExtractor(table.schema, message_type)
+
+    indices = [4, 0, 4, len(table) - 1]
+    assert message_extractor.read_table_rows(table, indices) == [
+        message_extractor.read_table_row(table, row) for row in indices
+    ]
+    assert message_extractor.read_table_rows(table, pa.array([], pa.int64())) == []
+    assert message_extractor.read_table_rows(table, [-1, -len(table)]) == [
+        message_extractor.read_table_row(table, -1),
+        message_extractor.read_table_row(table, 0),
+    ]
+    assert message_extractor.read_table_range(table, 2, 4) == [
+        message_extractor.read_table_row(table, row) for row in range(2, 4)
+    ]
+    assert message_extractor.read_table_range(table, -2, len(table) + 5) == [
+        message_extractor.read_table_row(table, row)
+        for row in range(len(table) - 2, len(table))
+    ]
+    assert message_extractor.read_table_range(table, 4, 2) == []
+    with pytest.raises(IndexError):
+        message_extractor.read_table_rows(table, [len(table)])
+    with pytest.raises(IndexError):
+        message_extractor.read_table_rows(table, [-len(table) - 1])
+
+
+def test_extractor_lookup():
+    source_messages = [
+        ExampleMessage(int32_value=i % 3, string_value=str(i), double_value=i)
+        for i in range(6)
+    ]
+    record_batch = messages_to_record_batch(source_messages, ExampleMessage)
+    message_extractor = MessageExtractor(record_batch.schema, ExampleMessage)
+
+    message_extractor.index_table(
+        pa.Table.from_batches([record_batch[:4]]), ["string_value"]
+    )
+    assert message_extractor.lookup("2") == source_messages[2]
+    assert message_extractor.lookup("5") is None
+    message_extractor.append_batches([record_batch[4:]])
+    assert message_extractor.lookup("5") == source_messages[5]
+    assert message_extractor.lookup_many(["5", "foo", "0", "5"]) == [
+        source_messages[5],
+        None,
+        source_messages[0],
+        source_messages[5],
+    ]
+    assert message_extractor.lookup_many([]) == []
+
+    message_extractor.index_table(
+        pa.Table.from_batches([record_batch]), ["int32_value", "string_value"]
+    )
+    assert message_extractor.lookup((1, "4")) == source_messages[4]
+    assert message_extractor.lookup((1, "3")) is None
+
+
+def test_extractor_lookup_last_row_wins():
+    source_messages = [
+        ExampleMessage(int32_value=i % 2, double_value=i) for i in range(5)
+    ]
+    table = messages_to_table(source_messages, ExampleMessage)
+    message_extractor = MessageExtractor(table.schema, ExampleMessage)
+    message_extractor.index_table(table, ["int32_value"])
+    assert message_extractor.lookup(0) == source_messages[4]
+    assert message_extractor.lookup(1) == source_messages[3]
+
+
+def test_extractor_lookup_errors():
+    table = messages_to_table([ExampleMessage()], ExampleMessage)
+    message_extractor = MessageExtractor(table.schema, ExampleMessage)
+    with pytest.raises(ValueError, match="No table indexed"):
+        message_extractor.lookup(1)
+    with pytest.raises(ValueError, match="No table indexed"):
+        message_extractor.append_batches(table.to_batches())
+    with pytest.raises(ValueError, match="non-empty list"):
+        message_extractor.index_table(table, "int32_value")
+    with pytest.raises(ValueError, match="non-empty list"):
+        message_extractor.index_table(table, [])
+    with pytest.raises(ValueError, match="Key column foo not found"):
+        message_extractor.index_table(table, ["foo"])
+
+
+def test_extractor_cache():
+    source_messages = [ExampleMessage(int32_value=i) for i in range(5)]
+    table = messages_to_table(source_messages, ExampleMessage)
+    message_extractor = MessageExtractor(table.schema, ExampleMessage, cache_size=2)
+
+    first = message_extractor.read_table_row(table, 1)
+    assert first == source_messages[1]
+    first.int32_value = 100
+    assert message_extractor.read_table_row(table, -4) == source_messages[1]
+    assert message_extractor.cache_info() == CacheInfo(
+        hits=1, misses=1, evictions=0, max_size=2, size=1
+    )
+
+    assert message_extractor.read_table_row(table, 2) == source_messages[2]
+    assert message_extractor.read_table_row(table, 3) == source_messages[3]
+    assert message_extractor.cache_info() == CacheInfo(
+        hits=1, misses=3, evictions=1, max_size=2, size=2
+    )
+
+    other_table = messages_to_table(source_messages[::-1], ExampleMessage)
+    assert message_extractor.read_table_row(other_table, 3) == source_messages[1]
+    assert message_extractor.cache_info().misses == 4
+
+    message_extractor.invalidate_cache(other_table)
+    assert message_extractor.cache_info().size == 1
+    message_extractor.invalidate_cache()
+    assert message_extractor.cache_info().size == 0
+    assert message_extractor.read_table_row(table, 3) == source_messages[3]
+    assert message_extractor.cache_info().misses == 5
+
+
+def test_extractor_cache_lookup():
+    source_messages = [ExampleMessage(int32_value=i) for i in range(5)]
+    table = messages_to_table(source_messages, ExampleMessage)
+    message_extractor = MessageExtractor(table.schema, ExampleMessage, cache_size=10)
+    message_extractor.index_table(table, ["int32_value"])
+
+    assert message_extractor.lookup(3) == source_messages[3]
+    assert message_extractor.lookup(3) == source_messages[3]
+    assert message_extractor.cache_info().hits == 1
+    message_extractor.append_batches(
+        [messages_to_record_batch([ExampleMessage(int32_value=5)], ExampleMessage)]
+    )
+    assert message_extractor.cache_info().size == 0
+    assert message_extractor.lookup(5) == ExampleMessage(int32_value=5)
+
+
+def test_extractor_cache_wrong_size():
+    with pytest.raises(ValueError, match="cache_size must be positive or 0"):
+        MessageExtractor(pa.schema([]), ExampleMessage, cache_size=-1)
+
+
 def test_empty():
     source_messages = [
         ExampleMessage(empty_value=Empty()),
@@ -641,6 +1092,34 @@ def test_repeated_primitives_array_slice():
     _check_messages_same(source_messages[1:], messages_back)
 
 
+@pytest.mark.parametrize(
+    "config", [ProtarrowConfig(), ProtarrowConfig(single_pass=True)]
+)
+def test_repeated_primitives_buffer(config: ProtarrowConfig):
+    messages = [
+        NestedExampleMessage(
+            example_message=ExampleMessage(
+                double_values=[1.5, -2.5],
+                float_values=[0.1],
+                int32_values=[-(2**31), 2**31 - 1],
+                uint64_values=[2**64 - 1],
+            )
+        ),
+        NestedExampleMessage(),
+        NestedExampleMessage(example_message=ExampleMessage(int64_values=[1, 2, 3])),
+    ]
+    record_batch = messages_to_record_batch(messages, NestedExampleMessage, config)
+    example_message = record_batch["example_message"]
+    assert example_message.field("int32_values").to_pylist() == [
+        [-(2**31), 2**31 - 1],
+        [],
+        [],
+    ]
+    assert example_message.field("uint64_values").to_pylist() == [[2**64 - 1], [], []]
+    assert example_message.field("int64_values").to_pylist() == [[], [], [1, 2, 3]]
+    assert record_batch_to_messages(record_batch, NestedExampleMessage) == messages
+
+
 def test_repeated_message_array_slice():
     source_messages = [
         NestedExampleMessage(
@@ -777,6 +1256,15 @@ def test_offset_values_array():
     slice_m1 = array[-1:]
     assert offset_values_array(slice_m1, slice_m1.values).to_pylist() == [1, 2, 3]
 
+    slice_head = array[:2]
+    assert offset_values_array(slice_head, slice_head.values).to_pylist() == [1, 1, 2]
+
+    slice_middle = array[1:2]
+    assert offset_values_array(slice_middle, slice_middle.values).to_pylist() == [
+        1,
+        2,
+    ]
+
 
 def test_cast_map_offset():
     config = ProtarrowConfig()
@@ -883,6 +1371,96 @@ def test_duration_specific():
     assert messages_back == expected
 
 
+@pytest.mark.parametrize("unit", ["s", "ms", "us", "ns"])
+def test_seconds_nanos_array_converter(unit: str):
+    timestamps = [
+        Timestamp(seconds=10, nanos=123456789),
+        Timestamp(seconds=-10, nanos=999999999),
+        None,
+        Timestamp(),
+    ]
+    durations = [
+        Duration(seconds=10, nanos=123456789),
+        Duration(seconds=-10, nanos=-999999999),
+        None,
+        Duration(),
+    ]
+    validity_mask = [True, True, True, False]
+
+    timestamp_converter = SecondsNanosArrayConverter(pa.timestamp(unit, "UTC"), True)
+    assert timestamp_converter(timestamps, validity_mask) == pa.array(
+        [
+            getattr(timestamps[0], f"To{_UNIT_NAMES[unit]}")(),
+            getattr(timestamps[1], f"To{_UNIT_NAMES[unit]}")(),
+            None,
+            None,
+        ],
+        pa.timestamp(unit, "UTC"),
+    )
+
+    duration_converter = SecondsNanosArrayConverter(pa.duration(unit), False)
+    assert duration_converter(durations, None) == pa.array(
+        [
+            getattr(durations[0], f"To{_UNIT_NAMES[unit]}")(),
+            getattr(durations[1], f"To{_UNIT_NAMES[unit]}")(),
+            None,
+            0,
+        ],
+        pa.duration(unit),
+    )
+
+
+_UNIT_NAMES = {
+    "s": "Seconds",
+    "ms": "Milliseconds",
+    "us": "Microseconds",
+    "ns": "Nanoseconds",
+}
+
+
+@pytest.mark.parametrize("config", CONFIGS)
+def test_repeated_and_map_timestamps(config: ProtarrowConfig):
+    messages = [
+        ExampleMessage(
+            timestamp_values=[Timestamp(seconds=1, nanos=2), Timestamp(seconds=3)],
+            duration_values=[Duration(seconds=1, nanos=2)],
+            timestamp_string_map={"foo": Timestamp(seconds=4, nanos=5)},
+            duration_int32_map={1: Duration(seconds=6, nanos=7)},
+        ),
+        ExampleMessage(),
+    ]
+    record_batch = messages_to_record_batch(messages, ExampleMessage, config)
+    messages_back = protarrow.record_batch_to_messages(record_batch, ExampleMessage)
+    assert messages_back == truncate_messages(messages, config)
+
+
+def test_invalid_timestamp():
+    messages = [ExampleMessage(timestamp_value=Timestamp(seconds=-62135596801))]
+    with pytest.raises(ValueError, match="Timestamp is not valid"):
+        messages_to_record_batch(messages, ExampleMessage)
+
+    messages = [ExampleMessage(timestamp_values=[Timestamp(nanos=-1)])]
+    with pytest.raises(ValueError, match="Timestamp is not valid"):
+        messages_to_record_batch(messages, ExampleMessage)
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        pa.array([0, 253402300800], pa.timestamp("s", "UTC")),
+        pa.array([-62135596801000], pa.timestamp("ms", "UTC")),
+    ],
+)
+def test_invalid_timestamp_to_proto(array: pa.Array):
+    for column, values in [
+        ("timestamp_value", array),
+        ("timestamp_values", pa.ListArray.from_arrays([0, len(array)], array)),
+    ]:
+        table = pa.table({column: values})
+        with pytest.raises(ValueError, match="Timestamp is not valid"):
+            table_to_messages(table, ExampleMessage)
+
+
 def test_large_list_primitive():
     table = pa.table(
         {
@@ -24,6 +24,7 @@ from .test_conversion import read_proto_jsonl
 CONFIGS = [
     ProtarrowConfig(skip_recursive_messages=False),
     ProtarrowConfig(skip_recursive_messages=True),
+    ProtarrowConfig(skip_recursive_messages=True, single_pass=True),
 ]
 DIR = pathlib.Path(__file__).parent
 
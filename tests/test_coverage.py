@@ -5,23 +5,21 @@ They cover scenarios that don't make sense IRL.
 
 import dataclasses
 import datetime
-from typing import Optional
+from typing import Optional, Union
 
 import pyarrow as pa
+import pyarrow.compute as pc
 import pytest
 from google.protobuf.descriptor import Descriptor, EnumDescriptor, FieldDescriptor
-from google.protobuf.wrappers_pb2 import BoolValue, DoubleValue
+from google.protobuf.wrappers_pb2 import DoubleValue
 from google.type.date_pb2 import Date
 
 import protarrow
 from protarrow import cast_record_batch
 from protarrow.arrow_to_proto import (
-    MapItemAssigner,
-    OffsetsIterator,
     OffsetToSize,
     OptionalNestedIterable,
     PlainAssigner,
-    RepeatedNestedIterable,
     _extract_array_messages,
     _extract_map_field,
     _extract_record_batch_messages,
@@ -185,37 +183,6 @@ def test_optional_nested_iterable():
     ]
 
 
-def test_map_item_assigner():
-    array = pa.array(
-        [[("hello", True), ("world", None)], None, ()],
-        pa.map_(pa.string(), pa.bool_()),
-    )
-
-    messages = [ExampleMessage(), ExampleMessage(), ExampleMessage()]
-    map_item_assigner = MapItemAssigner(
-        messages,
-        field_descriptor=ExampleMessage.DESCRIPTOR.fields_by_name[
-            "wrapped_bool_string_map"
-        ],
-        key_arrow_type=pa.string(),
-        value_arrow_type=pa.bool_(),
-        sizes=OffsetToSize(array.offsets),
-    )
-
-    for a, k, v in zip(map_item_assigner, array.keys, array.items):
-        a(k, v)
-    assert messages == [
-        ExampleMessage(
-            wrapped_bool_string_map={
-                "hello": BoolValue(value=True),
-                "world": BoolValue(value=False),
-            }
-        ),
-        ExampleMessage(),
-        ExampleMessage(),
-    ]
-
-
 def test_offset_to_size():
     assert list(OffsetToSize(pa.array([0, 5, 10]))) == [5, 5]
     assert list(OffsetToSize(pa.array([5, 10]))) == [5]
@@ -313,9 +280,8 @@ def test_plain_assigner_not_nullable():
     plain_assigner = PlainAssigner(
         messages=messages,
         field_descriptor=ExampleMessage.DESCRIPTOR.fields_by_name["double_value"],
-        arrow_type=pa.float64(),
     )
-    for a, v in zip(plain_assigner, pa.array([1.0, None], pa.float64())):
+    for a, v in zip(plain_assigner, [1.0, None]):
         a(v)
     assert messages == [ExampleMessage(double_value=1.0), ExampleMessage()]
 
@@ -331,9 +297,8 @@ def test_plain_assigner_nullable():
         field_descriptor=ExampleMessage.DESCRIPTOR.fields_by_name[
             "wrapped_double_value"
         ],
-        arrow_type=pa.float64(),
     )
-    for a, v in zip(plain_assigner, pa.array([1.0, 0.0, None], pa.float64())):
+    for a, v in zip(plain_assigner, [1.0, 0.0, None]):
         a(v)
     assert messages == [
         ExampleMessage(wrapped_double_value=DoubleValue(value=1.0)),
@@ -472,35 +437,17 @@ def test_misaligned_nested_iterable():
     assert nested == [None, None, None]
 
 
-def test_misaligned_nested_iterable_prime():
-    """Special case where the validity mask isn't aligned wit the nested values"""
-    iterable = OptionalNestedIterable(
-        [None, NestedExampleMessage(), None],
+def test_optional_nested_iterable_resolve():
+    parents = [NestedExampleMessage(), None, NestedExampleMessage()]
+    nested = OptionalNestedIterable(
+        parents,
         NestedExampleMessage.DESCRIPTOR.fields_by_name["example_message"],
-        [pa.scalar(False), pa.scalar(False), pa.scalar(True)],
-    )
-    iterable.prime()
-    nested = list(iterable)
-    assert nested == [None, None, None]
-
-
-def test_missing_parent_repeated_nested_iterable():
-    iterable = RepeatedNestedIterable(
-        [
-            None,
-            NestedExampleMessage(),
-            NestedExampleMessage(
-                repeated_example_message=[ExampleMessage(string_value="hello")]
-            ),
-        ],
-        NestedExampleMessage.DESCRIPTOR.fields_by_name["repeated_example_message"],
-    )
-    assert list(iterable) == [ExampleMessage(string_value="hello")]
-
-
-def test_coverage_offset_iterator():
-    offsets = OffsetsIterator(pa.array([]))
-    assert list(offsets) == []
+        [True, True, False],
+    ).resolve()
+    assert nested == [ExampleMessage(), None, None]
+    assert nested[0] is parents[0].example_message
+    assert parents[0].HasField("example_message")
+    assert not parents[2].HasField("example_message")
 
 
 def test_nested_iterable():
@@ -719,3 +666,51 @@ def test_can_pass_min_max_date():
         ExampleMessage(date_value=min_date),
         ExampleMessage(date_value=max_date),
     ]
+
+
+def test_repeated_dates():
+    messages = [
+        ExampleMessage(
+            date_values=[
+                Date(),
+                Date(year=1, month=1, day=1),
+                Date(year=2000, month=2, day=29),
+                Date(year=9999, month=12, day=31),
+            ]
+        ),
+        ExampleMessage(),
+    ]
+    table = protarrow.messages_to_table(messages, ExampleMessage)
+    assert pc.list_value_length(table["date_values"]).to_pylist() == [4, 0]
+    assert table["date_values"].combine_chunks().values == pa.array(
+        [-719163, -719162, 11_016, 2932896], pa.int32()
+    ).cast(pa.date32())
+    assert protarrow.table_to_messages(table, ExampleMessage) == messages
+
+
+@pytest.mark.parametrize(
+    "date",
+    [
+        Date(year=2021, month=2, day=29),
+        Date(year=2021, month=13, day=1),
+        Date(year=2021, month=0, day=0),
+        Date(year=10_000, month=1, day=1),
+        Date(year=-1, month=1, day=1),
+        # Days since epoch, out of range for Date
+        3_000_000,
+        -800_000,
+    ],
+)
+def test_invalid_date(date: Union[Date, int]):
+    with pytest.raises(ValueError, match="Date is not valid"):
+        if isinstance(date, Date):
+            protarrow.messages_to_table(
+                [ExampleMessage(date_value=date)], ExampleMessage
+            )
+        else:
+            protarrow.table_to_messages(
+                pa.table(
+                    {"date_value": pa.array([0, date], pa.int32()).cast(pa.date32())}
+                ),
+                ExampleMessage,
+            )